@@ -11,12 +11,32 @@ This script demonstrates:
 Run: python examples/analyze_active_channels.py
 """
 
+import csv
+import io
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from pathlib import Path
 
 from telebrief import MetricsAnalyzer, TelegramParser
 from telebrief.utils import Config
 
+# Prefetching only pays off once there is a next channel to overlap with
+MIN_CHANNELS_FOR_PREFETCH = 3
+
+CSV_BUFFER_SIZE = 1 << 20
+CSV_HEADER = ('channel', 'name', 'subscribers', 'posts', 'view_rate', 'posts_per_day',
+              'avg_views', 'quality', 'consistency')
+
+
+def write_csv(path, rows):
+    """Writes comparison rows to a CSV file."""
+    with open(path, 'w', newline='', encoding='utf-8', buffering=CSV_BUFFER_SIZE) as f:
+        writer = csv.writer(f)
+        writer.writerow(CSV_HEADER)
+        writer.writerows(rows)
+
 
 def analyze_active_channels():
     """Analyzes and compares multiple channels with performance optimization."""
@@ -47,45 +67,73 @@ def analyze_active_channels():
     print(f"🔄 Request rate: {config.network.requests_per_second} req/sec\n")
 
     results = {}
-    start_time = datetime.now()
-
-    for i, channel in enumerate(channels_to_compare, 1):
-        try:
-            print(f"🔄 [{i}/{len(channels_to_compare)}] Analyzing @{channel}...")
-
-            channel_data = parser.parse_channel(channel, days=analysis_days)
-            metrics = analyzer.analyze_channel(channel_data, days=analysis_days)
-
-            results[channel] = {
-                'name': channel_data.info.name,
-                'subscribers': channel_data.info.subscribers,
-                'posts_collected': len(channel_data.posts),
-                'view_rate': metrics.average_vr_percent,
-                'posts_per_day': metrics.posts_per_day,
-                'avg_views': metrics.avg_views_per_post,
-                'quality': metrics.engagement_quality,
-                'consistency': metrics.content_consistency
-            }
-
-            print(f"✅ {channel_data.info.name}")
-            print(f"   📊 {len(channel_data.posts)} posts | VR: {metrics.average_vr_percent:.1f}%")
-            print(f"   📈 {metrics.posts_per_day:.1f} posts/day | Quality: {metrics.engagement_quality}\n")
-
-        except Exception as e:
-            print(f"❌ Error analyzing @{channel}: {e}\n")
-            continue
+    # Summary aggregates are updated as each channel completes
+    best_vr = most_active = largest = None
+    total_posts = 0
+    vr_sum = 0.0
+    start_ns = time.perf_counter_ns()
+
+    # Single-slot prefetch: the worker downloads the next channel while the
+    # main thread analyzes the current one
+    use_prefetch = len(channels_to_compare) >= MIN_CHANNELS_FOR_PREFETCH
+    pending = None
+
+    with ThreadPoolExecutor(max_workers=1) as prefetcher:
+        for i, channel in enumerate(channels_to_compare, 1):
+            current = pending or prefetcher.submit(parser.parse_channel, channel, analysis_days)
+            pending = None
+            if use_prefetch and i < len(channels_to_compare):
+                pending = prefetcher.submit(
+                    parser.parse_channel, channels_to_compare[i], analysis_days
+                )
+
+            try:
+                print(f"🔄 [{i}/{len(channels_to_compare)}] Analyzing @{channel}...")
+
+                channel_data = current.result()
+                metrics = analyzer.analyze_channel(channel_data, days=analysis_days)
+
+                data = {
+                    'name': channel_data.info.name,
+                    'subscribers': channel_data.info.subscribers,
+                    'posts_collected': len(channel_data.posts),
+                    'view_rate': metrics.average_vr_percent,
+                    'posts_per_day': metrics.posts_per_day,
+                    'avg_views': metrics.avg_views_per_post,
+                    'quality': metrics.engagement_quality,
+                    'consistency': metrics.content_consistency
+                }
+                results[channel] = data
+
+                entry = (channel, data)
+                if best_vr is None or data['view_rate'] > best_vr[1]['view_rate']:
+                    best_vr = entry
+                if most_active is None or data['posts_per_day'] > most_active[1]['posts_per_day']:
+                    most_active = entry
+                if largest is None or data['subscribers'] > largest[1]['subscribers']:
+                    largest = entry
+                total_posts += data['posts_collected']
+                vr_sum += data['view_rate']
+
+                print(f"✅ {channel_data.info.name}")
+                print(f"   📊 {len(channel_data.posts)} posts | VR: {metrics.average_vr_percent:.1f}%")
+                print(f"   📈 {metrics.posts_per_day:.1f} posts/day | Quality: {metrics.engagement_quality}\n")
+
+            except Exception as e:
+                print(f"❌ Error analyzing @{channel}: {e}\n")
+                continue
 
     if not results:
         print("❌ No channels were successfully analyzed")
         return
 
     # Performance summary
-    elapsed = datetime.now() - start_time
-    total_posts = sum(data['posts_collected'] for data in results.values())
+    elapsed = (time.perf_counter_ns() - start_ns) / 1e9
+    avg_vr = vr_sum / len(results)
     
-    print(f"⏱️  Analysis completed in {elapsed.total_seconds():.1f}s")
+    print(f"⏱️  Analysis completed in {elapsed:.1f}s")
     print(f"📊 Analyzed {total_posts} posts from {len(results)} channels")
-    print(f"🚀 Average: {total_posts/elapsed.total_seconds():.1f} posts/second\n")
+    print(f"🚀 Average: {total_posts/elapsed:.1f} posts/second\n")
 
     # Results comparison table
     print("📋 Channel Comparison:")
@@ -93,13 +141,19 @@ def analyze_active_channels():
     print(f"{'Channel':<25} {'Subs':>8} {'Posts':>6} {'VR%':>6} {'Activity':>10} {'Quality':>12} {'Consistency':>12}")
     print("-" * 90)
 
-    # Sort by View-Rate for comparison
+    # Full ranking by View-Rate for the table and report
     sorted_results = sorted(results.items(), key=lambda x: x[1]['view_rate'], reverse=True)
 
-    for channel, data in sorted_results:
-        print(f"{data['name'][:24]:<25} {data['subscribers']:>8,} "
-              f"{data['posts_collected']:>6} {data['view_rate']:>5.1f}% "
-              f"{data['posts_per_day']:>9.1f} {data['quality']:>12} {data['consistency']:>12}")
+    # Plain tuples feed both the CSV file and the table below
+    rows = [
+        (channel, data['name'], data['subscribers'], data['posts_collected'], data['view_rate'],
+         data['posts_per_day'], data['avg_views'], data['quality'], data['consistency'])
+        for channel, data in sorted_results
+    ]
+
+    for _, name, subs, posts, vr, per_day, _, quality, consistency in rows:
+        print(f"{name[:24]:<25} {subs:>8,} {posts:>6} {vr:>5.1f}% "
+              f"{per_day:>9.1f} {quality:>12} {consistency:>12}")
 
     print("-" * 90)
 
@@ -108,45 +162,54 @@ def analyze_active_channels():
     os.makedirs("output/comparison", exist_ok=True)
     report_path = f"output/comparison/channels_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
 
-    with open(report_path, 'w', encoding='utf-8') as f:
-        f.write("MULTI-CHANNEL COMPARISON REPORT\n")
-        f.write("=" * 50 + "\n\n")
-        f.write(f"Analysis Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-        f.write(f"Period: {analysis_days} days\n")
-        f.write(f"Post Limit: {config.parsing.max_posts} per channel\n")
-        f.write(f"Processing Time: {elapsed.total_seconds():.1f} seconds\n")
-        f.write(f"Total Posts: {total_posts}\n")
-        f.write(f"Channels: {len(results)}\n\n")
-
-        f.write("CHANNEL RANKINGS (by View-Rate):\n")
-        f.write("-" * 40 + "\n")
-        for i, (channel, data) in enumerate(sorted_results, 1):
-            f.write(f"{i}. @{channel} - {data['name']}\n")
-            f.write(f"   Subscribers: {data['subscribers']:,}\n")
-            f.write(f"   Posts/day: {data['posts_per_day']:.1f}\n")
-            f.write(f"   View-Rate: {data['view_rate']:.1f}%\n")
-            f.write(f"   Quality: {data['quality']}\n")
-            f.write(f"   Consistency: {data['consistency']}\n\n")
-
-        # Comparison insights
-        best_vr = max(results.items(), key=lambda x: x[1]['view_rate'])
-        most_active = max(results.items(), key=lambda x: x[1]['posts_per_day'])
-        largest = max(results.items(), key=lambda x: x[1]['subscribers'])
-        
-        f.write("COMPARISON INSIGHTS:\n")
-        f.write("-" * 25 + "\n")
-        f.write(f"Best View-Rate: @{best_vr[0]} ({best_vr[1]['view_rate']:.1f}%)\n")
-        f.write(f"Most Active: @{most_active[0]} ({most_active[1]['posts_per_day']:.1f} posts/day)\n")
-        f.write(f"Largest Audience: @{largest[0]} ({largest[1]['subscribers']:,} subscribers)\n")
-        f.write(f"Average VR: {sum(d['view_rate'] for d in results.values())/len(results):.1f}%\n")
-
-    print(f"   📋 Report saved: {report_path}")
-
-    # Show insights
-    print(f"\n🔍 Key Insights:")
-    print(f"   🏆 Best View-Rate: @{best_vr[0]} ({best_vr[1]['view_rate']:.1f}%)")
-    print(f"   📈 Most Active: @{most_active[0]} ({most_active[1]['posts_per_day']:.1f} posts/day)")
-    print(f"   👥 Largest Audience: @{largest[0]} ({largest[1]['subscribers']:,} subscribers)")
+    # Build the whole report in memory and write it with a single call
+    buf = io.StringIO()
+    buf.write("MULTI-CHANNEL COMPARISON REPORT\n")
+    buf.write("=" * 50 + "\n\n")
+    buf.write(f"Analysis Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+    buf.write(f"Period: {analysis_days} days\n")
+    buf.write(f"Post Limit: {config.parsing.max_posts} per channel\n")
+    buf.write(f"Processing Time: {elapsed:.1f} seconds\n")
+    buf.write(f"Total Posts: {total_posts}\n")
+    buf.write(f"Channels: {len(results)}\n\n")
+
+    buf.write("CHANNEL RANKINGS (by View-Rate):\n")
+    buf.write("-" * 40 + "\n")
+    for i, (channel, data) in enumerate(sorted_results, 1):
+        buf.write(f"{i}. @{channel} - {data['name']}\n")
+        buf.write(f"   Subscribers: {data['subscribers']:,}\n")
+        buf.write(f"   Posts/day: {data['posts_per_day']:.1f}\n")
+        buf.write(f"   View-Rate: {data['view_rate']:.1f}%\n")
+        buf.write(f"   Quality: {data['quality']}\n")
+        buf.write(f"   Consistency: {data['consistency']}\n\n")
+
+    # Comparison insights
+    buf.write("COMPARISON INSIGHTS:\n")
+    buf.write("-" * 25 + "\n")
+    buf.write(f"Best View-Rate: @{best_vr[0]} ({best_vr[1]['view_rate']:.1f}%)\n")
+    buf.write(f"Most Active: @{most_active[0]} ({most_active[1]['posts_per_day']:.1f} posts/day)\n")
+    buf.write(f"Largest Audience: @{largest[0]} ({largest[1]['subscribers']:,} subscribers)\n")
+    buf.write(f"Average VR: {avg_vr:.1f}%\n")
+
+    csv_path = report_path.removesuffix('.txt') + '.csv'
+
+    # Files are written by a worker thread while the insights are printed
+    with ThreadPoolExecutor(max_workers=1) as file_writer:
+        report_saved = file_writer.submit(
+            Path(report_path).write_text, buf.getvalue(), encoding='utf-8'
+        )
+        csv_saved = file_writer.submit(write_csv, csv_path, rows)
+
+        # Show insights
+        print(f"\n🔍 Key Insights:")
+        print(f"   🏆 Best View-Rate: @{best_vr[0]} ({best_vr[1]['view_rate']:.1f}%)")
+        print(f"   📈 Most Active: @{most_active[0]} ({most_active[1]['posts_per_day']:.1f} posts/day)")
+        print(f"   👥 Largest Audience: @{largest[0]} ({largest[1]['subscribers']:,} subscribers)")
+
+        report_saved.result()
+        print(f"\n   📋 Report saved: {report_path}")
+        csv_saved.result()
+        print(f"   📈 CSV saved: {csv_path}")
 
     print("\n✨ Channel comparison completed!")
     print("\n💡 Analysis Tips:")
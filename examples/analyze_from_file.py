@@ -11,31 +11,31 @@ This script demonstrates:
 Run: python examples/analyze_from_file.py examples/simple_channels.txt
 """
 
+import heapq
 import os
 import sys
+from collections.abc import Iterator
 
 from telebrief import Config, DataExporter, MetricsAnalyzer, TelegramParser
 from telebrief.utils import get_logger
 
 
-def load_channels_from_file(filename: str) -> list[str]:
-    """Load channel names from text file."""
-    channels = []
+def load_channels_from_file(filename: str) -> Iterator[str]:
+    """Yield channel names from text file."""
     with open(filename, encoding="utf-8") as f:
         for raw_line in f:
             line = raw_line.strip()
             if line and not line.startswith("#"):
                 channel = line.lstrip("@")
                 if channel:
-                    channels.append(channel)
-    return channels
+                    yield channel
 
 
 def main(channels_file: str) -> None:
     """Analyze multiple channels from file."""
     logger = get_logger("batch_analyzer")
 
-    channels = load_channels_from_file(channels_file)
+    channels = list(load_channels_from_file(channels_file))
     logger.info(f"📂 Loaded {len(channels)} channels from {channels_file}")
 
     if not channels:
@@ -50,31 +50,29 @@ def main(channels_file: str) -> None:
     analyzer = MetricsAnalyzer()
     exporter = DataExporter()
 
-    all_channels = {}
     all_metrics = {}
+    total_posts = 0
+    vr_sum = 0.0
     analysis_days = 14  # Two weeks for comprehensive analysis
 
     logger.info(f"🚀 Starting batch analysis ({analysis_days} days per channel)")
 
-    for i, channel_name in enumerate(channels, 1):
-        try:
-            logger.info(f"[{i}/{len(channels)}] 📊 Analyzing @{channel_name}")
+    # Channels are fetched concurrently; failed channels are logged and skipped
+    all_channels = parser.parse_multiple_channels(channels, days=analysis_days)
 
-            channel = parser.parse_channel(channel_name, days=analysis_days)
-            metrics = analyzer.analyze_channel(channel, days=analysis_days)
+    for channel_name, channel in all_channels.items():
+        metrics = analyzer.analyze_channel(channel, days=analysis_days)
+        all_metrics[channel_name] = metrics
 
-            all_channels[channel_name] = channel
-            all_metrics[channel_name] = metrics
+        # Summary totals are accumulated here instead of re-scanning all metrics later
+        total_posts += metrics.total_posts
+        vr_sum += metrics.average_vr_percent
 
-            logger.info(
-                f"✅ @{channel_name}: {len(channel.posts)} posts, "
-                f"VR: {metrics.average_vr_percent:.1f}%, "
-                f"Quality: {metrics.engagement_quality}"
-            )
-
-        except Exception as e:
-            logger.error(f"❌ Error analyzing @{channel_name}: {e}")
-            continue
+        logger.info(
+            f"✅ @{channel_name}: {len(channel.posts)} posts, "
+            f"VR: {metrics.average_vr_percent:.1f}%, "
+            f"Quality: {metrics.engagement_quality}"
+        )
 
     if not all_channels:
         logger.error("No channels were successfully analyzed")
@@ -82,25 +80,24 @@ def main(channels_file: str) -> None:
 
     logger.info(f"📁 Exporting results for {len(all_channels)} channels...")
 
-    # Export comprehensive data
-    json_file = exporter.export_multiple_channels_json(all_channels, all_metrics)
+    # Export comprehensive data; one session keeps the file timestamps in sync
+    session = exporter.begin_session()
+    json_file = exporter.export_multiple_channels_json(all_channels, all_metrics, session=session)
     logger.info(f"📊 JSON exported: {json_file}")
 
-    csv_file = exporter.export_metrics_csv(all_metrics)
+    csv_file = exporter.export_metrics_csv(all_metrics, session=session)
     logger.info(f"📈 CSV exported: {csv_file}")
 
     # Create summary report
-    report_file = exporter.export_summary_report(all_channels, all_metrics)
+    report_file = exporter.export_summary_report(all_channels, all_metrics, session=session)
     logger.info(f"📋 Summary report: {report_file}")
 
-    # Display rankings
-    sorted_channels = sorted(
-        all_metrics.items(), key=lambda x: x[1].average_vr_percent, reverse=True
-    )
+    # Display rankings: only the top 10 is shown, so a bounded heap beats a full sort
+    top_channels = heapq.nlargest(10, all_metrics.items(), key=lambda x: x[1].average_vr_percent)
 
-    logger.info(f"\n🏆 Channel Rankings (Top {min(10, len(sorted_channels))}):")
+    logger.info(f"\n🏆 Channel Rankings (Top {len(top_channels)}):")
     logger.info("-" * 80)
-    for i, (name, m) in enumerate(sorted_channels[:10], 1):
+    for i, (name, m) in enumerate(top_channels, 1):
         logger.info(
             f"{i:2d}. @{name:<20} "
             f"VR: {m.average_vr_percent:6.1f}% | "
@@ -110,8 +107,7 @@ def main(channels_file: str) -> None:
         )
 
     # Show statistics
-    total_posts = sum(m.total_posts for m in all_metrics.values())
-    avg_vr = sum(m.average_vr_percent for m in all_metrics.values()) / len(all_metrics)
+    avg_vr = vr_sum / len(all_metrics)
 
     logger.info(f"\n📊 Batch Analysis Summary:")
     logger.info(f"   Channels processed: {len(all_channels)}")
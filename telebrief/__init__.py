@@ -38,13 +38,24 @@ __version__ = "1.0.0"
 __author__ = "Anatoliy Fedorenko"
 __license__ = "MIT"
 
-from typing import Any
+import importlib
+from typing import TYPE_CHECKING, Any
 
-from .cli import main as cli_main
-from .core import DataExporter, MetricsAnalyzer, TelegramParser
 from .models import Channel, ChannelInfo, Metrics, Post
 from .utils import Config, NetworkConfig, ParsingConfig
 
+if TYPE_CHECKING:
+    from .cli import main as cli_main
+    from .core import DataExporter, MetricsAnalyzer, TelegramParser
+
+# Heavy re-exports resolved on first access: {name: (module, attribute)}
+_LAZY_ATTRS = {
+    "DataExporter": (".core", "DataExporter"),
+    "MetricsAnalyzer": (".core", "MetricsAnalyzer"),
+    "TelegramParser": (".core", "TelegramParser"),
+    "cli_main": (".cli", "main"),
+}
+
 __all__ = [
     "Channel",
     "ChannelInfo",
@@ -63,6 +74,17 @@ __all__ = [
 ]
 
 
+def __getattr__(name: str) -> Any:
+    """Import core components on first access (PEP 562)."""
+    if name not in _LAZY_ATTRS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module_name, attr = _LAZY_ATTRS[name]
+    value = getattr(importlib.import_module(module_name, __name__), attr)
+    globals()[name] = value
+    return value
+
+
 def quick_analyze(channel_name: str, days: int = 30, **kwargs: Any) -> dict:
     """
     Quick channel analysis in one function.
@@ -79,6 +101,8 @@ def quick_analyze(channel_name: str, days: int = 30, **kwargs: Any) -> dict:
         result = quick_analyze('bloomberg', days=7)
         print(f"View-Rate: {result['metrics']['average_vr_percent']:.1f}%")
     """
+    from .core import MetricsAnalyzer, TelegramParser  # noqa: PLC0415
+
     config = Config()
 
     for key, value in kwargs.items():
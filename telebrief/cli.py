@@ -1,11 +1,40 @@
 """CLI interface for Telebrief."""
 
 import argparse
+import dataclasses
+import functools
+import operator
+import re
 import sys
+from collections.abc import Callable, Iterator
+from typing import TYPE_CHECKING, Any
 
-from .core import DataExporter, MetricsAnalyzer, TelegramParser
-from .models import Metrics
-from .utils import Config, setup_logger
+from .utils import Config, NetworkConfig, ParsingConfig, setup_logger
+
+if TYPE_CHECKING:
+    from .core import DataExporter
+    from .models import Channel, Metrics
+
+# CLI defaults come from the config dataclasses
+_CONFIG_DEFAULTS = {f.name: f.default for f in dataclasses.fields(Config)}
+_PARSING_DEFAULTS = ParsingConfig()
+
+DEFAULT_INFO_CACHE_TTL = 24 * 60 * 60  # Channel info changes on the order of days
+
+# Optional scheme, optional t.me/ or t.me/s/ prefix, optional @, the username,
+# then optionally a post path, query or fragment; the whole text must match
+CHANNEL_NAME_REGEX = re.compile(r"(?:https?://)?(?:t\.me/(?:s/)?)?@?(\w+)(?:[/?#].*)?", re.ASCII)
+
+
+def positive_int(value: str) -> int:
+    """Argparse type for integers that must be at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}") from None
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1: {value}")
+    return number
 
 
 def create_parser() -> argparse.ArgumentParser:
@@ -64,8 +93,8 @@ Supported channel formats:
         "--days",
         "-d",
         type=int,
-        default=30,
-        help="Number of days to analyze (default: 30)",
+        default=_PARSING_DEFAULTS.default_days,
+        help="Number of days to analyze (default: %(default)s)",
     )
 
     parser.add_argument(
@@ -82,16 +111,16 @@ Supported channel formats:
         "--format",
         "-f",
         choices=["json", "csv", "both"],
-        default="json",
-        help="Output format (default: json)",
+        default=_CONFIG_DEFAULTS["output_format"],
+        help="Output format (default: %(default)s)",
     )
 
     parser.add_argument(
         "--output",
         "-o",
         type=str,
-        default="output",
-        help="Directory to save results (default: output)",
+        default=_CONFIG_DEFAULTS["output_dir"],
+        help="Directory to save results (default: %(default)s)",
     )
 
     parser.add_argument(
@@ -102,6 +131,12 @@ Supported channel formats:
         "--proxy", type=str, help="Proxy in host:port format (e.g., 127.0.0.1:8081)"
     )
 
+    parser.add_argument(
+        "--workers",
+        type=positive_int,
+        help="Channels parsed concurrently (default: one per request per second)",
+    )
+
     parser.add_argument(
         "--no-ssl", action="store_true", help="Disable SSL certificate verification"
     )
@@ -114,9 +149,43 @@ Supported channel formats:
         "--no-age-info", action="store_true", help="Don't fetch channel age information"
     )
 
+    parser.add_argument(
+        "--html2text",
+        action="store_true",
+        help="Convert post text with html2text (full Markdown fidelity, slower)",
+    )
+
+    parser.add_argument(
+        "--info-cache-ttl",
+        type=int,
+        default=DEFAULT_INFO_CACHE_TTL,
+        help=f"Seconds to reuse cached channel info (default: {DEFAULT_INFO_CACHE_TTL})",
+    )
+
+    parser.add_argument(
+        "--post-cache-ttl",
+        type=int,
+        help="Seconds to reuse cached posts instead of re-parsing channels (default: disabled)",
+    )
+
+    parser.add_argument("--no-cache", action="store_true", help="Ignore cached data and refresh it")
+
     return parser
 
 
+@functools.lru_cache(maxsize=4096)
+def extract_channel_name(text: str) -> str:
+    """
+    Extract channel name from plain, @-prefixed or t.me URL formats.
+
+    Text in none of these formats is returned stripped but otherwise as is,
+    so channel validation reports it instead of it turning into another name.
+    """
+    text = text.strip()
+    match = CHANNEL_NAME_REGEX.fullmatch(text)
+    return match.group(1) if match else text
+
+
 def parse_channels(channels_str: str) -> list[str]:
     """
     Parses channel string into a list.
@@ -130,32 +199,11 @@ def parse_channels(channels_str: str) -> list[str]:
     if not channels_str:
         return []
 
-    def extract_channel_name(text: str) -> str:
-        """Extract channel name from various formats."""
-        text = text.strip()
-
-        if text.startswith(("https://", "http://")):
-            text = text.split("://", 1)[1]
-
-        if text.startswith("t.me/"):
-            text = text[5:]
-            if text.startswith("s/"):
-                text = text[2:]
-
-        if text.startswith("@"):
-            text = text[1:]
-
-        text = text.split("/")[0].split("?")[0]
-
-        return text
-
     channels = []
     for raw_channel in channels_str.split(","):
-        channel_text = raw_channel.strip()
-        if channel_text:
-            channel_name = extract_channel_name(channel_text)
-            if channel_name:
-                channels.append(channel_name)
+        channel_name = extract_channel_name(raw_channel)
+        if channel_name:
+            channels.append(channel_name)
 
     return channels
 
@@ -171,9 +219,9 @@ def parse_periods(periods_str: str) -> list[int]:
         raise ValueError("Periods must be numbers") from e
 
 
-def parse_channels_from_file(filepath: str) -> list[str]:
+def parse_channels_from_file(filepath: str) -> Iterator[str]:
     """
-    Reads list of channels from a file.
+    Reads channels from a file lazily, one at a time.
 
     Supported formats:
     - One channel per line
@@ -190,30 +238,12 @@ def parse_channels_from_file(filepath: str) -> list[str]:
     Args:
         filepath: Path to file with channel list
 
-    Returns:
-        List of channels
-    """
-    channels = []
-
-    def extract_channel_name(text: str) -> str:
-        """Extract channel name from various formats."""
-        text = text.strip()
-
-        if text.startswith(("https://", "http://")):
-            text = text.split("://", 1)[1]
-
-        if text.startswith("t.me/"):
-            text = text[5:]
-            if text.startswith("s/"):
-                text = text[2:]
-
-        if text.startswith("@"):
-            text = text[1:]
-
-        text = text.split("/")[0].split("?")[0]
-
-        return text
+    Yields:
+        Channel names in file order
 
+    Raises:
+        ValueError: If the file is missing or can't be read (raised on iteration)
+    """
     try:
         with open(filepath, encoding="utf-8") as f:
             for raw_line in f:
@@ -221,90 +251,165 @@ def parse_channels_from_file(filepath: str) -> list[str]:
                 if not line:
                     continue
 
-                if "," in line:
-                    for raw_channel in line.split(","):
-                        channel_text = raw_channel.strip()
-                        if channel_text:
-                            channel_name = extract_channel_name(channel_text)
-                            if channel_name:
-                                channels.append(channel_name)
-                else:
-                    channel_name = extract_channel_name(line)
+                for raw_channel in line.split(","):
+                    channel_name = extract_channel_name(raw_channel)
                     if channel_name:
-                        channels.append(channel_name)
+                        yield channel_name
 
     except FileNotFoundError as e:
         raise ValueError(f"File not found: {filepath}") from e
     except Exception as e:
         raise ValueError(f"Error reading file {filepath}: {e}") from e
 
-    return channels
+
+# Arguments passed to the config constructors: (argument, "section.field", transform).
+# Unset arguments (None, False or "") leave the dataclass default in place.
+_ARG_MAP: list[tuple[str, str, Callable[[Any], Any] | None]] = [
+    ("channels", "channels", parse_channels),
+    ("days", "parsing.default_days", None),
+    ("max_posts", "parsing.max_posts", None),
+    ("no_ssl", "network.verify_ssl", operator.not_),
+    ("workers", "network.max_workers", None),
+    ("output", "output_dir", None),
+    ("format", "output_format", None),
+    ("no_metrics", "include_metrics", operator.not_),
+    ("periods", "analysis_periods", parse_periods),
+    ("log_level", "log_level", None),
+    ("no_age_info", "parsing.fetch_age_info", operator.not_),
+    ("html2text", "parsing.html2text_markdown", None),
+    ("info_cache_ttl", "parsing.info_cache_ttl", None),
+    ("post_cache_ttl", "parsing.post_cache_ttl", None),
+]
 
 
 def setup_config_from_args(args: argparse.Namespace) -> Config:
     """Creates configuration from command line arguments."""
-    config = Config()
+    kwargs: dict[str, dict[str, Any]] = {"": {}, "network": {}, "parsing": {}}
 
-    if hasattr(args, "channels") and args.channels:
-        config.channels = parse_channels(args.channels)
+    for attr, target, transform in _ARG_MAP:
+        value = getattr(args, attr, None)
+        if value is None or value is False or value == "":
+            continue
 
-    if hasattr(args, "days") and args.days is not None:
-        config.parsing.default_days = args.days
+        section, _, field_name = target.rpartition(".")
+        kwargs[section][field_name] = transform(value) if transform else value
 
-    if hasattr(args, "max_posts") and args.max_posts is not None:
-        config.parsing.max_posts = args.max_posts
+    # Priority: --channels-file > channels argument
+    channels_file = getattr(args, "channels_file", None)
+    if channels_file:
+        kwargs[""]["channels"] = list(parse_channels_from_file(channels_file))
 
-    if hasattr(args, "proxy") and args.proxy:
+    proxy = getattr(args, "proxy", None)
+    if proxy:
         try:
-            host, port = args.proxy.split(":")
-            config.network.proxy_host = host
-            config.network.proxy_port = int(port)
-            config.network.use_proxy = True
+            host, port = proxy.split(":")
+            kwargs["network"].update(proxy_host=host, proxy_port=int(port), use_proxy=True)
         except ValueError as e:
             raise ValueError("Proxy must be in host:port format") from e
 
-    if hasattr(args, "no_ssl") and args.no_ssl:
-        config.network.verify_ssl = False
+    if getattr(args, "no_cache", False):
+        parsing = kwargs["parsing"]
+        parsing["info_cache_ttl"] = 0
+        if parsing.get("post_cache_ttl") is not None:
+            parsing["post_cache_ttl"] = 0
+
+    # Built in one go so the dataclasses validate the combined values
+    return Config(
+        network=NetworkConfig(**kwargs["network"]),
+        parsing=ParsingConfig(**kwargs["parsing"]),
+        **kwargs[""],
+    )
 
-    if hasattr(args, "output") and args.output:
-        config.output_dir = args.output
 
-    if hasattr(args, "format") and args.format:
-        config.output_format = args.format
+def _export_without_metrics(
+    channels: dict[str, "Channel"], output_format: str, exporter: "DataExporter"
+) -> list[str]:
+    """Exports parsed channels without metrics. Returns created files."""
+    created_files = []
+    session = exporter.begin_session()
 
-    if hasattr(args, "no_metrics") and args.no_metrics:
-        config.include_metrics = False
+    if output_format in ["json", "both"]:
+        if len(channels) == 1:
+            channel = next(iter(channels.values()))
+            created_files.append(
+                exporter.export_channel_json(channel, include_metrics=False, session=session)
+            )
+        else:
+            created_files.append(exporter.export_multiple_channels_json(channels, session=session))
+
+    if output_format in ["csv", "both"]:
+        created_files.extend(
+            exporter.export_posts_csv(channel, session=session) for channel in channels.values()
+        )
+
+    return created_files
+
+
+def _export_with_metrics(
+    channels: dict[str, "Channel"],
+    metrics_by_channel: dict[str, dict[int, "Metrics"]],
+    periods: list[int],
+    output_format: str,
+    exporter: "DataExporter",
+) -> list[str]:
+    """Exports parsed channels with metrics for the longest period. Returns created files."""
+    created_files = []
+    session = exporter.begin_session()
+    main_period = max(periods)
+    main_metrics = {name: by_period[main_period] for name, by_period in metrics_by_channel.items()}
+
+    if output_format in ["json", "both"]:
+        if len(channels) == 1:
+            channel_name, channel = next(iter(channels.items()))
+            # Metrics are embedded only when a single period was requested
+            single_metrics = main_metrics.get(channel_name) if len(periods) == 1 else None
+            created_files.append(
+                exporter.export_channel_json(channel, metrics=single_metrics, session=session)
+            )
+        else:
+            created_files.append(
+                exporter.export_multiple_channels_json(channels, main_metrics, session=session)
+            )
 
-    if hasattr(args, "periods") and args.periods:
-        config.analysis_periods = parse_periods(args.periods)
+    if output_format in ["csv", "both"]:
+        created_files.extend(
+            exporter.export_posts_csv(channel, session=session) for channel in channels.values()
+        )
 
-    if hasattr(args, "log_level") and args.log_level:
-        config.log_level = args.log_level
+        all_metrics: dict[str, Metrics | dict[str, Metrics]] = {
+            name: by_period[main_period]
+            if len(periods) == 1
+            else {f"{period}_days": metrics for period, metrics in by_period.items()}
+            for name, by_period in metrics_by_channel.items()
+        }
+        if all_metrics:
+            created_files.append(exporter.export_metrics_csv(all_metrics, session=session))
 
-    if hasattr(args, "no_age_info") and args.no_age_info:
-        config.parsing.fetch_age_info = False
+    if len(channels) > 1 and main_metrics:
+        created_files.append(
+            exporter.export_summary_report(channels, main_metrics, session=session)
+        )
 
-    return config
+    return created_files
 
 
-def main() -> int:
+def main() -> int:  # noqa: PLR0911 - one early exit per failure stage
     """Main CLI function."""
     parser = create_parser()
     args = parser.parse_args()
 
-    config = setup_config_from_args(args)
+    try:
+        config = setup_config_from_args(args)
+    except ValueError as e:
+        # Values argparse can't check alone, such as a bad port, period list or channel file
+        sys.stderr.write(f"{parser.prog}: error: {e}\n")
+        return 1
     logger = setup_logger(level=config.log_level, log_to_file=config.log_to_file, log_dir="logs")
 
     logger.info("Starting Telegram channel analysis")
 
-    # Priority: --channels-file > channels argument
-    if hasattr(args, "channels_file") and args.channels_file:
-        try:
-            config.channels = parse_channels_from_file(args.channels_file)
-            logger.info(f"Loaded {len(config.channels)} channels from file {args.channels_file}")
-        except ValueError as e:
-            logger.error(str(e))
-            return 1
+    if args.channels_file:
+        logger.info(f"Loaded {len(config.channels)} channels from file {args.channels_file}")
 
     if not config.channels:
         logger.error("No channels specified for analysis")
@@ -315,6 +420,10 @@ def main() -> int:
 
     logger.info(f"Channels to analyze: {config.channels}")
 
+    # Imported here so that --help and argument errors don't pay for the
+    # networking and HTML parsing stack
+    from .core import DataExporter, MetricsAnalyzer, TelegramParser  # noqa: PLC0415
+
     try:
         parser_instance = TelegramParser(config)
         analyzer = MetricsAnalyzer()
@@ -334,78 +443,15 @@ def main() -> int:
             logger.error("Failed to parse any channels")
             return 1
 
-        all_metrics: dict[str, Metrics | dict[str, Metrics]] = {}
-        if not args.no_metrics:
-            for channel_name, channel in channels.items():
-                channel_metrics = {}
-                for period in periods:
-                    metrics = analyzer.analyze_channel(channel, period)
-                    channel_metrics[f"{period}_days"] = metrics
-
-                if len(periods) == 1:
-                    all_metrics[channel_name] = channel_metrics[f"{periods[0]}_days"]
-                else:
-                    all_metrics[channel_name] = channel_metrics
-
-        created_files = []
-
-        if args.format in ["json", "both"]:
-            if len(channels) == 1:
-                channel_name = next(iter(channels.keys()))
-                channel = channels[channel_name]
-                single_metrics: Metrics | None = None
-                if not args.no_metrics:
-                    channel_data = all_metrics.get(channel_name)
-                    if isinstance(channel_data, Metrics):
-                        single_metrics = channel_data
-                    elif isinstance(channel_data, dict) and len(periods) == 1:
-                        single_metrics = channel_data.get(f"{periods[0]}_days")
-
-                json_file = exporter.export_channel_json(
-                    channel, include_metrics=not args.no_metrics, metrics=single_metrics
-                )
-                created_files.append(json_file)
-            else:
-                export_metrics: dict[str, Metrics] | None = None
-                if not args.no_metrics:
-                    export_metrics = {}
-                    for name in all_metrics:  # noqa: PLC0206
-                        channel_data = all_metrics[name]
-                        if isinstance(channel_data, Metrics):
-                            export_metrics[name] = channel_data
-                        elif isinstance(channel_data, dict):
-                            main_period = max(periods) if periods else 30
-                            period_metrics = channel_data.get(f"{main_period}_days")
-                            if period_metrics:
-                                export_metrics[name] = period_metrics
-
-                json_file = exporter.export_multiple_channels_json(channels, export_metrics)
-                created_files.append(json_file)
-
-        if args.format in ["csv", "both"]:
-            for _channel_name, channel in channels.items():
-                csv_file = exporter.export_posts_csv(channel)
-                created_files.append(csv_file)
-
-            if not args.no_metrics and all_metrics:
-                metrics_csv = exporter.export_metrics_csv(all_metrics)
-                created_files.append(metrics_csv)
-
-        if len(channels) > 1 and not args.no_metrics:
-            main_metrics: dict[str, Metrics] = {}
-            for name in all_metrics:  # noqa: PLC0206
-                channel_data = all_metrics[name]
-                if isinstance(channel_data, dict):
-                    main_period = max(periods)
-                    period_metrics = channel_data.get(f"{main_period}_days")
-                    if period_metrics:
-                        main_metrics[name] = period_metrics
-                elif isinstance(channel_data, Metrics):
-                    main_metrics[name] = channel_data
-
-            if main_metrics:
-                report_file = exporter.export_summary_report(channels, main_metrics)
-                created_files.append(report_file)
+        if args.no_metrics:
+            _export_without_metrics(channels, args.format, exporter)
+            return 0
+
+        metrics_by_channel = {
+            channel_name: analyzer.analyze_channel_multi(channel, periods)
+            for channel_name, channel in channels.items()
+        }
+        _export_with_metrics(channels, metrics_by_channel, periods, args.format, exporter)
 
         return 0
 
@@ -5,11 +5,12 @@ Contains parser, metrics analyzer, and data exporter.
 """
 
 from .analyzer import MetricsAnalyzer
-from .exporter import DataExporter
+from .exporter import DataExporter, ExportSession
 from .parser import TelegramParser
 
 __all__ = [
     "DataExporter",
+    "ExportSession",
     "MetricsAnalyzer",
     "TelegramParser",
 ]
@@ -1,13 +1,18 @@
 """Metrics analyzer for Telegram channels."""
 
-import statistics
+from bisect import bisect_left
 from datetime import datetime, timedelta
+from operator import attrgetter
+from typing import cast
+
+import numpy as np
 
 from ..models import Channel, Metrics, Post
 from ..models.constants import (
     MAX_TREND_WINDOWS,
     MIN_VALUES_FOR_GINI,
     MIN_WINDOWS_FOR_TREND,
+    PERCENTILE_50,
     PERCENTILE_75,
     PERCENTILE_90,
     TOP_POSTS_PERCENTAGE,
@@ -15,7 +20,6 @@ from ..models.constants import (
     TREND_GROWTH_THRESHOLD,
 )
 from ..utils import get_logger
-from ..utils.date_utils import parse_date
 
 
 class MetricsAnalyzer:
@@ -46,95 +50,149 @@ class MetricsAnalyzer:
         else:
             posts = channel.posts
 
+        return self._analyze_posts(channel, posts, days)
+
+    def analyze_channel_multi(self, channel: Channel, periods: list[int]) -> dict[int, Metrics]:
+        """
+        Analyze channel metrics for several periods at once.
+
+        Posts are sorted by date once and each period's window is located by
+        binary search, instead of re-filtering all posts for every period.
+
+        Args:
+            channel: Channel to analyze
+            periods: Periods in days (0 uses all posts)
+
+        Returns:
+            Dictionary {period: Metrics} in the order of periods
+        """
+        if not channel.posts:
+            return {period: Metrics() for period in periods}
+
+        self.logger.info(f"Analyzing metrics for @{channel.info.channel} for {periods} days")
+
+        dated_posts, dates = self._sort_by_date(channel.posts)
+        now = datetime.now()
+
+        results = {}
+        for period in periods:
+            if period:
+                start = bisect_left(dates, now - timedelta(days=period))
+                posts = dated_posts[start:]
+            else:
+                posts = channel.posts
+            results[period] = self._analyze_posts(channel, posts, period)
+
+        return results
+
+    @staticmethod
+    def _sort_by_date(posts: list[Post]) -> tuple[list[Post], list[datetime]]:
+        """Return dated posts sorted by date and their dates, for bisect lookups."""
+        dated_posts = sorted((p for p in posts if p.date), key=attrgetter("date"))
+        return dated_posts, [cast(datetime, p.date) for p in dated_posts]
+
+    def _analyze_posts(self, channel: Channel, posts: list[Post], days: int | None) -> Metrics:
+        """Calculate metrics for the posts selected from channel."""
         metrics = Metrics()
-        metrics.total_posts = len(posts)
-        metrics.total_views = sum(post.views for post in posts)
         metrics.analysis_period_days = days or 0
 
-        self._calculate_view_metrics(metrics, posts)
-        self._calculate_vr_metrics(metrics, posts, channel.info.subscribers)
-        self._calculate_activity_metrics(metrics, posts, days or 0, channel.info.subscribers)
-        self._calculate_quality_metrics(metrics, posts)
+        if not posts:
+            return metrics
+
+        # Views are copied into an array and sorted once; every helper reads
+        # order statistics from the same ascending array
+        views = np.fromiter((p.views for p in posts), dtype=np.int64, count=len(posts))
+        views.sort()
+
+        metrics.total_posts = len(posts)
+        metrics.total_views = int(views.sum())
+
+        subscribers = channel.info.subscribers
+        self._calculate_view_metrics(metrics, views)
+        self._calculate_vr_metrics(metrics, views, subscribers)
+        self._calculate_activity_metrics(metrics, views, days or 0, subscribers)
+        self._calculate_quality_metrics(metrics, views)
 
         self.logger.info(f"Analysis completed. VR: {metrics.average_vr_percent:.1f}%")
 
         return metrics
 
-    def _calculate_view_metrics(self, metrics: Metrics, posts: list[Post]) -> None:
+    @staticmethod
+    def _percentiles(sorted_values: np.ndarray, quantiles: list[float]) -> np.ndarray:
+        """
+        Linearly interpolated percentiles of an ascending array.
+
+        Args:
+            sorted_values: Non-empty array sorted in ascending order
+            quantiles: Quantiles in the 0..1 range
+
+        Returns:
+            Array with one value per quantile
+        """
+        positions = np.asarray(quantiles, dtype=np.float64) * (sorted_values.size - 1)
+        lower = positions.astype(np.intp)
+        upper = np.minimum(lower + 1, sorted_values.size - 1)
+        weight = positions - lower
+        return sorted_values[lower] * (1 - weight) + sorted_values[upper] * weight
+
+    def _calculate_view_metrics(self, metrics: Metrics, sorted_views: np.ndarray) -> None:
         """Calculate basic view metrics."""
-        views = [p.views for p in posts]
+        views = sorted_views
+        (median,) = self._percentiles(views, [PERCENTILE_50])
 
-        metrics.avg_views_per_post = statistics.mean(views)
-        metrics.median_views_per_post = int(statistics.median(views))
-        metrics.max_views = max(views)
-        metrics.min_views = min(views)
+        avg = float(views.mean())
 
-        if len(views) > 1:
-            metrics.views_std_dev = statistics.stdev(views)
-            if metrics.avg_views_per_post > 0:
-                metrics.views_cv = metrics.views_std_dev / metrics.avg_views_per_post
+        metrics.avg_views_per_post = avg
+        metrics.median_views_per_post = int(median)
+        metrics.max_views = int(views[-1])
+        metrics.min_views = int(views[0])
+
+        if views.size > 1:
+            std_dev = float(views.std(ddof=1))
+            metrics.views_std_dev = std_dev
+            if avg > 0:
+                metrics.views_cv = std_dev / avg
             else:
                 metrics.views_cv = 0
         else:
             metrics.views_std_dev = 0
             metrics.views_cv = 0
 
-    def _calculate_vr_metrics(self, metrics: Metrics, posts: list[Post], subscribers: int) -> None:
+    def _calculate_vr_metrics(
+        self, metrics: Metrics, sorted_views: np.ndarray, subscribers: int
+    ) -> None:
         """Calculate View-Rate metrics."""
         if subscribers == 0:
             return
 
-        vr_values = [(p.views / subscribers) * 100 for p in posts]
-
-        metrics.average_vr_percent = statistics.mean(vr_values)
-        metrics.median_vr_percent = statistics.median(vr_values)
+        # VR is views scaled by a positive constant, so its mean and
+        # percentiles are the scaled statistics of views
+        views = sorted_views
+        scale = 100 / subscribers
+        median, p75, p90 = self._percentiles(views, [PERCENTILE_50, PERCENTILE_75, PERCENTILE_90])
+        avg = float(views.mean())
 
-        sorted_vr = sorted(vr_values)
-        n = len(sorted_vr)
-
-        p90_index = (n - 1) * PERCENTILE_90
-        if p90_index == int(p90_index):
-            metrics.percentile_90_vr = sorted_vr[int(p90_index)]
-        else:
-            lower = int(p90_index)
-            upper = lower + 1
-            weight = p90_index - lower
-            metrics.percentile_90_vr = sorted_vr[lower] * (1 - weight) + sorted_vr[upper] * weight
-
-        p75_index = (n - 1) * PERCENTILE_75
-        if p75_index == int(p75_index):
-            metrics.percentile_75_vr = sorted_vr[int(p75_index)]
-        else:
-            lower = int(p75_index)
-            upper = lower + 1
-            weight = p75_index - lower
-            metrics.percentile_75_vr = sorted_vr[lower] * (1 - weight) + sorted_vr[upper] * weight
+        metrics.average_vr_percent = avg * scale
+        metrics.median_vr_percent = float(median) * scale
+        metrics.percentile_75_vr = float(p75) * scale
+        metrics.percentile_90_vr = float(p90) * scale
 
-        above_avg = sum(1 for vr in vr_values if vr >= metrics.average_vr_percent)
-        metrics.consistency_index_percent = (above_avg / len(vr_values)) * 100
+        above_avg = np.count_nonzero(views >= avg)
+        metrics.consistency_index_percent = (above_avg / views.size) * 100
 
     def _calculate_activity_metrics(
-        self, metrics: Metrics, posts: list[Post], period_days: int, subscribers: int
+        self, metrics: Metrics, sorted_views: np.ndarray, period_days: int, subscribers: int
     ) -> None:
         """Calculate activity metrics."""
+        views = sorted_views
         if period_days > 0:
-            metrics.posts_per_day = len(posts) / period_days
+            metrics.posts_per_day = views.size / period_days
         else:
             metrics.posts_per_day = 0
 
-        if posts:
-            sorted_views = sorted([p.views for p in posts])
-            n = len(sorted_views)
-
-            p90_index = (n - 1) * PERCENTILE_90
-            if p90_index == int(p90_index):
-                metrics.active_subs_estimate = int(sorted_views[int(p90_index)])
-            else:
-                lower = int(p90_index)
-                upper = min(lower + 1, n - 1)
-                weight = p90_index - lower
-                p90_views = sorted_views[lower] * (1 - weight) + sorted_views[upper] * weight
-                metrics.active_subs_estimate = int(p90_views)
+        if views.size:
+            (p90,) = self._percentiles(views, [PERCENTILE_90])
+            metrics.active_subs_estimate = int(p90)
 
             if subscribers > 0:
                 metrics.activation_ratio_percent = (
@@ -143,39 +201,44 @@ class MetricsAnalyzer:
             else:
                 metrics.activation_ratio_percent = 0
 
-    def _calculate_quality_metrics(self, metrics: Metrics, posts: list[Post]) -> None:
+    def _calculate_quality_metrics(self, metrics: Metrics, sorted_views: np.ndarray) -> None:
         """Calculate content quality metrics."""
-        if not posts:
+        n = sorted_views.size
+        if n < MIN_VALUES_FOR_GINI:
+            # A lone post holds all the views and there is no inequality to measure
+            metrics.top_10_percent_share = 100.0 if n and sorted_views[0] > 0 else 0.0
+            metrics.gini_coefficient = 0.0
             return
 
-        views = [p.views for p in posts]
-        total_views = sum(views)
+        total_views = int(sorted_views.sum())
 
-        sorted_views = sorted(views, reverse=True)
-        top_10_count = max(1, len(posts) // TOP_POSTS_PERCENTAGE)
-        top_10_views = sum(sorted_views[:top_10_count])
+        # The largest views are at the end of the ascending array
+        top_10_count = max(1, sorted_views.size // TOP_POSTS_PERCENTAGE)
+        top_10_views = int(sorted_views[-top_10_count:].sum())
 
         if total_views > 0:
             metrics.top_10_percent_share = (top_10_views / total_views) * 100
         else:
             metrics.top_10_percent_share = 0
 
-        metrics.gini_coefficient = self._calculate_gini([float(v) for v in views])
+        metrics.gini_coefficient = self._calculate_gini(sorted_views)
 
-    def _calculate_gini(self, values: list[float]) -> float:
-        """Calculate Gini coefficient for distribution."""
-        if not values or len(values) < MIN_VALUES_FOR_GINI:
-            return 0
+    def _calculate_gini(self, sorted_values: np.ndarray) -> float:
+        """
+        Calculate Gini coefficient for an ascending distribution.
 
-        sorted_values = sorted(values)
-        n = len(sorted_values)
-        cumsum = sum(sorted_values)
+        Uses the Lorenz-curve form G = (n + 1 - 2 * sum(cumsum(x)) / sum(x)) / n.
+        """
+        n = sorted_values.size
+        if n < MIN_VALUES_FOR_GINI:
+            return 0
 
-        if cumsum == 0:
+        total = sorted_values.sum()
+        if total == 0:
             return 0
 
-        index = sum((i + 1) * value for i, value in enumerate(sorted_values))
-        return (2 * index) / (n * cumsum) - (n + 1) / n
+        cumulative = np.cumsum(sorted_values, dtype=np.float64)
+        return float((n + 1 - 2 * cumulative.sum() / total) / n)
 
     def compare_periods(self, channel: Channel, periods: list[int]) -> dict:
         """
@@ -190,12 +253,9 @@ class MetricsAnalyzer:
         """
         self.logger.info(f"Comparing periods {periods} for @{channel.info.channel}")
 
-        results = {}
-        for period in periods:
-            metrics = self.analyze_channel(channel, period)
-            results[f"{period}_days"] = metrics
-
-        return results
+        # Posts are sorted once and each period is sliced by binary search
+        metrics_by_period = self.analyze_channel_multi(channel, periods)
+        return {f"{period}_days": metrics for period, metrics in metrics_by_period.items()}
 
     def get_trend_analysis(self, channel: Channel, window_days: int = 7) -> dict:
         """
@@ -211,30 +271,39 @@ class MetricsAnalyzer:
         if not channel.posts:
             return {}
 
+        # Posts are sorted by date once; each window is then a slice found
+        # by binary search instead of a scan over all posts
+        dated_posts, dates = self._sort_by_date(channel.posts)
+
+        # Prefix sums of views in date order give any window's total in O(1)
+        views_prefix = np.zeros(len(dated_posts) + 1, dtype=np.int64)
+        np.cumsum(
+            np.fromiter((p.views for p in dated_posts), dtype=np.int64, count=len(dated_posts)),
+            out=views_prefix[1:],
+        )
+
         windows = []
         current_date = datetime.now()
 
         while True:
             window_start = current_date - timedelta(days=window_days)
-            window_posts = []
-            for p in channel.posts:
-                post_date = parse_date(p.date)
-                if post_date and window_start <= post_date < current_date:
-                    window_posts.append(p)
+            start = bisect_left(dates, window_start)
+            end = bisect_left(dates, current_date)
+            posts_count = end - start
 
-            if not window_posts:
+            if not posts_count:
                 break
 
-            avg_views = statistics.mean([p.views for p in window_posts])
+            avg_views = int(views_prefix[end] - views_prefix[start]) / posts_count
             vr = (avg_views / channel.info.subscribers) * 100 if channel.info.subscribers else 0
 
             windows.append(
                 {
                     "period": f"{window_start.strftime('%Y-%m-%d')} - {current_date.strftime('%Y-%m-%d')}",
-                    "posts_count": len(window_posts),
+                    "posts_count": posts_count,
                     "avg_views": round(avg_views, 0),
                     "vr_percent": round(vr, 2),
-                    "posts_per_day": len(window_posts) / window_days if window_days > 0 else 0,
+                    "posts_per_day": posts_count / window_days if window_days > 0 else 0,
                 }
             )
 
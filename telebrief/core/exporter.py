@@ -1,13 +1,45 @@
 """Data exporter for Telebrief."""
 
 import csv
-import json
+import heapq
+import io
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 from ..models import Channel, Metrics
-from ..utils import get_logger
+from ..utils import get_logger, json_utils
+
+CSV_BUFFER_SIZE = 1 << 20  # Flush CSV output in 1 MB chunks
+
+SUMMARY_TOP_CHANNELS = 5  # Channels listed in the summary report ranking
+REPORT_TITLE_RULE = "=" * 60 + "\n"
+REPORT_SECTION_RULE = "-" * 30 + "\n"
+
+# Line breaks in post text become spaces so every post stays on one CSV line
+NEWLINES_TO_SPACES = str.maketrans("\r\n", "  ")
+
+
+@dataclass(frozen=True)
+class ExportSession:
+    """Timestamps shared by a batch of exports so their names and contents match."""
+
+    created_at: datetime
+    timestamp: str  # For filenames
+    isoformat: str  # For payloads
+
+    # to_dict() results reused within the batch: {id(obj): (obj, dict)}.
+    # The object is kept alongside so its id can't be recycled meanwhile.
+    dicts: dict[int, tuple[Channel | Metrics, dict]] = field(
+        default_factory=dict, repr=False, compare=False
+    )
+
+    @classmethod
+    def now(cls) -> "ExportSession":
+        """Create session for the current time."""
+        created_at = datetime.now()
+        return cls(created_at, created_at.strftime("%Y%m%d_%H%M%S"), created_at.isoformat())
 
 
 class DataExporter:
@@ -15,15 +47,43 @@ class DataExporter:
 
     def __init__(self, output_dir: str = "output"):
         self.output_dir = Path(output_dir)
-        self.output_dir.mkdir(exist_ok=True)
+        # Config leaves the directory alone; it is created once output is written
+        self.output_dir.mkdir(parents=True, exist_ok=True)
         self.logger = get_logger(f"{__name__}.{self.__class__.__name__}")
 
+    def begin_session(self) -> ExportSession:
+        """
+        Start a batch of exports sharing one timestamp.
+
+        Channel and metrics dictionaries are built once per session, so
+        objects must not be modified between the exports of one batch.
+        """
+        return ExportSession.now()
+
+    def _to_dict(self, obj: Channel | Metrics, session: ExportSession) -> dict:
+        """Return obj.to_dict(), computed once per object in a session and shallow-copied."""
+        cached = session.dicts.get(id(obj))
+        if cached is None or cached[0] is not obj:
+            cached = (obj, obj.to_dict())
+            session.dicts[id(obj)] = cached
+        return dict(cached[1])
+
+    def _channel_payload(
+        self, channel: Channel, metrics: Metrics | None, session: ExportSession
+    ) -> dict:
+        """Channel dictionary with its metrics attached, if any."""
+        data = self._to_dict(channel, session)
+        if metrics:
+            data["metrics"] = self._to_dict(metrics, session)
+        return data
+
     def export_channel_json(
         self,
         channel: Channel,
         filename: str | None = None,
         include_metrics: bool = True,
         metrics: Metrics | None = None,
+        session: ExportSession | None = None,
     ) -> str:
         """
         Export channel data to JSON.
@@ -33,23 +93,19 @@ class DataExporter:
             filename: Filename (if None, generated automatically)
             include_metrics: Include metrics
             metrics: Metrics to include
+            session: Shared export timestamps (if None, taken now)
 
         Returns:
             Path to created file
         """
+        session = session or ExportSession.now()
         if not filename:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"{channel.info.channel}_{timestamp}.json"
+            filename = f"{channel.info.channel}_{session.timestamp}.json"
 
         filepath = self.output_dir / filename
 
-        data = channel.to_dict()
-
-        if include_metrics and metrics:
-            data["metrics"] = metrics.to_dict()
-
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        data = self._channel_payload(channel, metrics if include_metrics else None, session)
+        filepath.write_bytes(json_utils.dumps(data, indent=True))
 
         self.logger.info(f"Channel exported to JSON: {filepath}")
         return str(filepath)
@@ -59,6 +115,7 @@ class DataExporter:
         channels: dict[str, Channel],
         metrics: dict[str, Metrics] | None = None,
         filename: str | None = None,
+        session: ExportSession | None = None,
     ) -> str:
         """
         Export multiple channels to one JSON file.
@@ -67,70 +124,72 @@ class DataExporter:
             channels: Dictionary of channels
             metrics: Dictionary of metrics
             filename: Filename
+            session: Shared export timestamps (if None, taken now)
 
         Returns:
             Path to created file
         """
+        session = session or ExportSession.now()
         if not filename:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"channels_analysis_{timestamp}.json"
+            filename = f"channels_analysis_{session.timestamp}.json"
 
         filepath = self.output_dir / filename
 
+        metrics = metrics or {}
         data: dict[str, Any] = {
-            "generated_at": datetime.now().isoformat(),
+            "generated_at": session.isoformat,
             "total_channels": len(channels),
-            "channels": {},
+            "channels": {
+                name: self._channel_payload(channel, metrics.get(name), session)
+                for name, channel in channels.items()
+            },
         }
 
-        for name, channel in channels.items():
-            channel_data = channel.to_dict()
-
-            if metrics and name in metrics:
-                channel_data["metrics"] = metrics[name].to_dict()
-
-            data["channels"][name] = channel_data
-
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        filepath.write_bytes(json_utils.dumps(data, indent=True))
 
         self.logger.info(f"Exported {len(channels)} channels to JSON: {filepath}")
         return str(filepath)
 
-    def export_posts_csv(self, channel: Channel, filename: str | None = None) -> str:
+    def export_posts_csv(
+        self,
+        channel: Channel,
+        filename: str | None = None,
+        session: ExportSession | None = None,
+    ) -> str:
         """
         Export channel posts to CSV.
 
         Args:
             channel: Channel to export
             filename: Filename
+            session: Shared export timestamps (if None, taken now)
 
         Returns:
             Path to created file
         """
+        session = session or ExportSession.now()
         if not filename:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"{channel.info.channel}_posts_{timestamp}.csv"
+            filename = f"{channel.info.channel}_posts_{session.timestamp}.csv"
 
         filepath = self.output_dir / filename
 
         headers = ["channel", "post_id", "views", "date", "author", "text"]
+        channel_name = channel.info.channel
 
-        with open(filepath, "w", newline="", encoding="utf-8") as f:
+        with open(filepath, "w", newline="", encoding="utf-8", buffering=CSV_BUFFER_SIZE) as f:
             writer = csv.writer(f)
             writer.writerow(headers)
-
-            for post in channel.posts:
-                writer.writerow(
-                    [
-                        channel.info.channel,
-                        post.post_id or "",
-                        post.views,
-                        post.date.isoformat() if post.date else "",
-                        post.author,
-                        post.text.replace("\n", " "),
-                    ]
+            writer.writerows(
+                (
+                    channel_name,
+                    post.post_id or "",
+                    post.views,
+                    post.date.isoformat() if post.date else "",
+                    post.author,
+                    post.text.translate(NEWLINES_TO_SPACES),
                 )
+                for post in channel.posts
+            )
 
         self.logger.info(f"Posts exported to CSV: {filepath}")
         return str(filepath)
@@ -139,6 +198,7 @@ class DataExporter:
         self,
         metrics_data: dict[str, Metrics | dict[str, Metrics]],
         filename: str | None = None,
+        session: ExportSession | None = None,
     ) -> str:
         """
         Export metrics to CSV.
@@ -146,13 +206,14 @@ class DataExporter:
         Args:
             metrics_data: Metrics data (channel -> metrics or channel -> period -> metrics)
             filename: Filename
+            session: Shared export timestamps (if None, taken now)
 
         Returns:
             Path to created file
         """
+        session = session or ExportSession.now()
         if not filename:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"metrics_analysis_{timestamp}.csv"
+            filename = f"metrics_analysis_{session.timestamp}.csv"
 
         filepath = self.output_dir / filename
 
@@ -171,7 +232,7 @@ class DataExporter:
             self.logger.warning("No data to export to CSV")
             return ""
 
-        with open(filepath, "w", newline="", encoding="utf-8") as f:
+        with open(filepath, "w", newline="", encoding="utf-8", buffering=CSV_BUFFER_SIZE) as f:
             writer = csv.DictWriter(f, fieldnames=rows[0].keys())
             writer.writeheader()
             writer.writerows(rows)
@@ -212,6 +273,7 @@ class DataExporter:
         channels: dict[str, Channel],
         metrics: dict[str, Metrics],
         filename: str | None = None,
+        session: ExportSession | None = None,
     ) -> str:
         """
         Create summary report in text format.
@@ -220,56 +282,70 @@ class DataExporter:
             channels: Dictionary of channels
             metrics: Dictionary of metrics
             filename: Filename
+            session: Shared export timestamps (if None, taken now)
 
         Returns:
             Path to created file
         """
+        session = session or ExportSession.now()
         if not filename:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"summary_report_{timestamp}.txt"
+            filename = f"summary_report_{session.timestamp}.txt"
 
         filepath = self.output_dir / filename
 
-        with open(filepath, "w", encoding="utf-8") as f:
-            f.write("TELEBRIEF - CHANNEL ANALYSIS SUMMARY\n")
-            f.write("=" * 60 + "\n\n")
-            f.write(f"Generated at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"Total channels: {len(channels)}\n\n")
-
-            total_posts = sum(len(ch.posts) for ch in channels.values())
-            total_subs = sum(ch.info.subscribers for ch in channels.values())
-
-            f.write("OVERALL STATISTICS:\n")
-            f.write("-" * 30 + "\n")
-            f.write(f"Total posts: {total_posts:,}\n")
-            f.write(f"Total subscribers: {total_subs:,}\n\n")
+        # Channel details are rendered in the same pass that sums the totals
+        # shown above them, then the sections are joined once
+        details: list[str] = []
+        total_posts = 0
+        total_subs = 0
+
+        for channel_name, channel in channels.items():
+            post_count = len(channel.posts)
+            subscribers = channel.info.subscribers
+            total_posts += post_count
+            total_subs += subscribers
+
+            details.append(
+                f"@{channel_name} - {channel.info.name}\n"
+                f"  Subscribers: {subscribers:,}\n"
+                f"  Posts in sample: {post_count}\n"
+            )
+            m = metrics.get(channel_name)
+            if m is not None:
+                details.append(
+                    f"  View-Rate: {m.average_vr_percent:.1f}%\n"
+                    f"  Activity: {m.posts_per_day:.1f} posts/day\n"
+                    f"  Quality: {m.engagement_quality}\n"
+                )
+            details.append("\n")
 
-            f.write("CHANNEL DETAILS:\n")
-            f.write("-" * 30 + "\n\n")
+        buf = io.StringIO()
+        buf.write("TELEBRIEF - CHANNEL ANALYSIS SUMMARY\n")
+        buf.write(REPORT_TITLE_RULE + "\n")
+        buf.write(f"Generated at: {session.created_at.strftime('%Y-%m-%d %H:%M:%S')}\n")
+        buf.write(f"Total channels: {len(channels)}\n\n")
 
-            for channel_name, channel in channels.items():
-                f.write(f"@{channel_name} - {channel.info.name}\n")
-                f.write(f"  Subscribers: {channel.info.subscribers:,}\n")
-                f.write(f"  Posts in sample: {len(channel.posts)}\n")
+        buf.write("OVERALL STATISTICS:\n")
+        buf.write(REPORT_SECTION_RULE)
+        buf.write(f"Total posts: {total_posts:,}\n")
+        buf.write(f"Total subscribers: {total_subs:,}\n\n")
 
-                if channel_name in metrics:
-                    m = metrics[channel_name]
-                    f.write(f"  View-Rate: {m.average_vr_percent:.1f}%\n")
-                    f.write(f"  Activity: {m.posts_per_day:.1f} posts/day\n")
-                    f.write(f"  Quality: {m.engagement_quality}\n")
+        buf.write("CHANNEL DETAILS:\n")
+        buf.write(REPORT_SECTION_RULE + "\n")
+        buf.write("".join(details))
 
-                f.write("\n")
+        if metrics:
+            top_channels = heapq.nlargest(
+                SUMMARY_TOP_CHANNELS, metrics.items(), key=lambda x: x[1].average_vr_percent
+            )
 
-            if metrics:
-                sorted_channels = sorted(
-                    metrics.items(), key=lambda x: x[1].average_vr_percent, reverse=True
-                )
+            buf.write(f"TOP-{SUMMARY_TOP_CHANNELS} CHANNELS BY VIEW-RATE:\n")
+            buf.write(REPORT_SECTION_RULE)
 
-                f.write("TOP-5 CHANNELS BY VIEW-RATE:\n")
-                f.write("-" * 30 + "\n")
+            for i, (name, m) in enumerate(top_channels, 1):
+                buf.write(f"{i}. @{name}: {m.average_vr_percent:.1f}%\n")
 
-                for i, (name, m) in enumerate(sorted_channels[:5], 1):
-                    f.write(f"{i}. @{name}: {m.average_vr_percent:.1f}%\n")
+        filepath.write_text(buf.getvalue(), encoding="utf-8")
 
         self.logger.info(f"Summary report created: {filepath}")
         return str(filepath)
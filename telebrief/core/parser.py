@@ -2,32 +2,218 @@
 Telegram channel parser module.
 """
 
+import functools
 import html
+import math
 import re
+import string
+import threading
 import time
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
-from typing import Any, cast
+from pathlib import Path
+from typing import Any
 
 import html2text
 import requests
 import urllib3
-from bs4 import BeautifulSoup, Tag
+from bs4 import BeautifulSoup
+from lxml import etree
+from lxml import html as lxml_html
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
 
 from ..models import Channel, ChannelInfo, Post
-from ..models.constants import DEFAULT_USER_AGENT, EARLIEST_POST_ID, POST_ID_PARTS_COUNT
-from ..utils import Config, ProgressLogger, get_logger
-from ..utils.date_utils import parse_date
+from ..models.constants import DEFAULT_USER_AGENT, EARLIEST_POST_ID
+from ..utils import Config, InfoCache, ProgressLogger, TokenBucket, get_logger, json_utils
+from ..utils.date_utils import parse_date, parse_dates
+from ..utils.postcache import PostCache
 
 # Constants
 DEFAULT_POSTS_BATCH_SIZE = 20  # Batch size for posts from Telegram
 K_MULTIPLIER = 1_000
 M_MULTIPLIER = 1_000_000
 MIN_CHANNEL_NAME_LENGTH = 3
+HTML_CACHE_SIZE = 4096  # Converted HTML fragments kept in memory
+
+SUFFIX_MULTIPLIERS = {"K": K_MULTIPLIER, "k": K_MULTIPLIER, "M": M_MULTIPLIER, "m": M_MULTIPLIER}
 
 # Pre-compiled regular expressions for performance
-VIEWS_CLEANUP_REGEX = re.compile(r"[^\d.]")
-NUMBER_CLEANUP_REGEX = re.compile(r"[^\d.,]")
-BEFORE_REGEX = re.compile(r"before=(\d+)")
+HTML_WHITESPACE_REGEX = re.compile(r"[ \t\n\r\f]+")
+POST_TIME_REGEX = re.compile(r'<time\b[^>]*\bdatetime="([^"]+)"')
+
+# Markup emitted around an element's content by the fast Markdown converter
+MARKDOWN_WRAPPERS = {
+    "b": "**",
+    "strong": "**",
+    "i": "_",
+    "em": "_",
+    "u": "_",
+    "s": "~~",
+    "del": "~~",
+    "strike": "~~",
+    "code": "`",
+}
+MARKDOWN_BLOCK_TAGS = frozenset({"div", "p", "blockquote", "pre", "ul", "ol", "li"})
+
+
+def _class_xpath(tag: str, class_name: str) -> str:
+    """XPath step matching tag elements that have class_name among their classes."""
+    return f"{tag}[contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')]"
+
+
+# Post fields found by class in a single walk over each post element
+POST_FIELD_CLASSES = {
+    "tgme_widget_message_author_name": "author",
+    "tgme_widget_message_text": "text",
+    "tgme_widget_message_views": "views",
+}
+
+# XPath queries for post extraction, compiled once at import
+# (lxml is used directly on the hot path)
+SELECT_POSTS = etree.XPath("//" + _class_xpath("div", "tgme_widget_message"))
+SELECT_MORE_LINK_HREF = etree.XPath(
+    "//"
+    + _class_xpath("div", "js-messages_more_wrap")
+    + "//"
+    + _class_xpath("a", "js-messages_more")
+    + "/@href",
+    smart_strings=False,
+)
+
+
+def _make_html_converter() -> html2text.HTML2Text:
+    """Create html2text converter with the settings used for posts."""
+    converter = html2text.HTML2Text()
+    converter.ignore_links = False
+    converter.ignore_images = True
+    converter.body_width = 0
+    converter.wrap_links = False
+    return converter
+
+
+# html2text keeps conversion state on the instance, so every worker
+# thread gets its own converter instead of sharing one behind a lock
+_thread_local = threading.local()
+
+
+def _get_html_converter() -> html2text.HTML2Text:
+    """Return the calling thread's html2text converter, creating it on first use."""
+    converter: html2text.HTML2Text | None = getattr(_thread_local, "html_converter", None)
+    if converter is None:
+        converter = _thread_local.html_converter = _make_html_converter()
+    return converter
+
+
+@functools.lru_cache(maxsize=HTML_CACHE_SIZE)
+def _convert_html(html_content: str) -> str:
+    """
+    Convert HTML fragment to Markdown with empty lines removed.
+
+    Results are memoized: reposts, templated posts and single-emoji posts
+    repeat the same fragments, which then skip html2text entirely.
+    """
+    markdown = _get_html_converter().handle(html_content)
+
+    # Stripped non-empty lines, joined in one pass without intermediate lists
+    return "\n".join(line for line in map(str.strip, markdown.split("\n")) if line)
+
+
+def _fast_html_to_md(root: lxml_html.HtmlElement) -> str:
+    """
+    Convert parsed HTML element to lightweight Markdown.
+
+    Covers the markup Telegram uses in posts (bold, italic, strikethrough,
+    inline code, links and line breaks) in a single walk over the tree.
+    Emoji are reduced to their text. Lines are stripped and empty lines
+    dropped as they are produced.
+    """
+    lines: list[str] = []
+    parts: list[str] = []
+
+    def break_line() -> None:
+        line = "".join(parts).strip()
+        if line:
+            lines.append(line)
+        parts.clear()
+
+    def emit(text: str | None) -> None:
+        if text:
+            parts.append(HTML_WHITESPACE_REGEX.sub(" ", text))
+
+    def close_emphasis(marker: str, start: int) -> None:
+        # Markdown emphasis can't start or end with a space, so whitespace at
+        # the edges of the content moves outside the markers at parts[start - 1]
+        content = "".join(parts[start:])
+        text = content.strip()
+        if not text:
+            parts[start - 1 :] = [content]
+            return
+        leading = content[: len(content) - len(content.lstrip())]
+        trailing = content[len(content.rstrip()) :]
+        parts[start - 1 :] = [leading, marker, text, marker, trailing]
+
+    # Open elements with their remaining children, the text emitted when
+    # they end (None ends the line), and for emphasis the position of its
+    # content in parts along with the line count it started on (else -1)
+    stack: list[tuple[Any, Iterator[Any], str | None, int, int]] = [
+        (root, iter(root), None, -1, -1)
+    ]
+    emit(root.text)
+
+    while stack:
+        elem, children, closer, start, line_count = stack[-1]
+        child = next(children, None)
+        if child is None:
+            stack.pop()
+            if closer is None:
+                break_line()
+            elif start >= 0 and line_count == len(lines):
+                close_emphasis(closer, start)
+            else:
+                parts.append(closer)
+            if stack:
+                emit(elem.tail)
+            continue
+
+        tag = child.tag
+        if not isinstance(tag, str):  # Comments and processing instructions
+            emit(child.tail)
+            continue
+
+        if tag == "br":
+            break_line()
+            emit(child.tail)
+            continue
+
+        href = child.get("href") if tag == "a" else None
+        if href and child.text_content() == href:
+            parts.append(f"<{href}>")
+            emit(child.tail)
+            continue
+
+        if tag == "i" and "emoji" in (child.get("class") or "").split():
+            parts.append(child.text_content())
+            emit(child.tail)
+            continue
+
+        start = -1
+        if tag in MARKDOWN_BLOCK_TAGS:
+            break_line()
+            closer = None
+        elif href:
+            parts.append("[")
+            closer = f"]({href})"
+        else:
+            closer = MARKDOWN_WRAPPERS.get(tag, "")
+            parts.append(closer)
+            if closer:
+                start = len(parts)
+
+        emit(child.text)
+        stack.append((child, iter(child), closer, start, len(lines)))
+
+    return "\n".join(lines)
 
 
 class TelegramParser:
@@ -41,16 +227,27 @@ class TelegramParser:
         self.session = requests.Session()
         self._setup_session()
 
-        self.html_converter = html2text.HTML2Text()
-        self.html_converter.ignore_links = False
-        self.html_converter.ignore_images = True
-        self.html_converter.body_width = 0
-        self.html_converter.wrap_links = False
+        # Shared by all worker threads so the rate applies to the whole parser
+        self.rate_limiter = TokenBucket(
+            self.config.network.requests_per_second, self.config.network.burst
+        )
+
+        self.info_cache: InfoCache | None = None
+        if self.config.parsing.info_cache_ttl is not None:
+            self.info_cache = InfoCache(Path(self.config.cache_dir) / "info")
+
+        self.post_cache: PostCache | None = None
+        if self.config.parsing.post_cache_ttl is not None:
+            self.post_cache = PostCache(Path(self.config.cache_dir) / "posts")
 
     def _setup_session(self) -> None:
         """Configure HTTP session with proxy and SSL settings."""
         self.session.headers.update(
-            {"User-Agent": DEFAULT_USER_AGENT, "X-Requested-With": "XMLHttpRequest"}
+            {
+                "User-Agent": DEFAULT_USER_AGENT,
+                "X-Requested-With": "XMLHttpRequest",
+                "Connection": "keep-alive",
+            }
         )
 
         if self.config.network.use_proxy and self.config.network.proxy_url:
@@ -62,6 +259,15 @@ class TelegramParser:
 
         self.session.verify = self.config.network.verify_ssl
 
+        # All requests go to the same host: keep one pooled connection per
+        # concurrently parsed channel so keep-alive connections are reused
+        # instead of being discarded when the pool is full. Retries are done
+        # by _make_request, which also waits on the rate limiter between them.
+        pool_size = max(DEFAULT_POOLSIZE, self._channel_concurrency())
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
         if not self.config.network.verify_ssl:
             self.logger.warning("SSL verification disabled")
             urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
@@ -77,7 +283,7 @@ class TelegramParser:
         Returns:
             Channel object with posts and metrics
         """
-        channel_name = channel_name.lstrip("@")
+        channel_name = channel_name.removeprefix("@")
         days = days or self.config.parsing.default_days
 
         if days <= 0:
@@ -86,28 +292,39 @@ class TelegramParser:
         if len(channel_name) < MIN_CHANNEL_NAME_LENGTH or " " in channel_name:
             raise ValueError(f"Invalid channel name: @{channel_name}")
 
+        max_posts = self.config.parsing.max_posts
+        post_cache_ttl = self.config.parsing.post_cache_ttl
+        if self.post_cache is not None and post_cache_ttl is not None:
+            cached_channel = self.post_cache.load(channel_name, days, max_posts, post_cache_ttl)
+            if cached_channel is not None:
+                self.logger.info(
+                    f"Using cached @{channel_name} ({len(cached_channel.posts)} posts for {days} days)"
+                )
+                return cached_channel
+
         self.logger.info(f"Parsing @{channel_name} for {days} days")
 
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         try:
-            channel_info = self._get_channel_info(channel_name)
+            channel_info = self._load_channel_info(channel_name)
             self.logger.info(
                 f"Channel found: {channel_info.name} ({channel_info.subscribers:,} subscribers)"
             )
 
-            posts, latest_post_id = self._get_posts(channel_name, days)
+            posts, _latest_post_id = self._get_posts(channel_name, days)
             self.logger.info(f"Collected {len(posts)} posts for {days} days")
 
             channel = Channel(info=channel_info, posts=posts)
 
-            if self.config.parsing.fetch_age_info:
-                self._get_channel_age_info(channel.info, latest_post_id)
+            if self.post_cache is not None:
+                self.post_cache.store(channel, days, max_posts)
 
-            elapsed_time = time.time() - start_time
+            elapsed_time = time.perf_counter() - start_time
             self.logger.info(
                 f"Parsing channel @{channel_name} completed successfully in {elapsed_time:.2f} sec"
             )
+            self.logger.debug(f"Markdown conversion cache: {_convert_html.cache_info()}")
             return channel
 
         except Exception as e:
@@ -118,57 +335,125 @@ class TelegramParser:
         self, channel_names: list[str], days: int | None = None
     ) -> dict[str, Channel]:
         """
-        Parse multiple channels.
+        Parse multiple channels concurrently.
+
+        Batches of at least network.async_threshold channels are fetched in
+        a thread pool, so total time is close to the slowest channel rather
+        than the sum of all. The shared rate limiter keeps the overall
+        request rate within network.requests_per_second.
 
         Args:
             channel_names: List of channel names
             days: Number of days to analyze
 
         Returns:
-            Dictionary {channel_name: Channel}
+            Dictionary {channel_name: Channel} in the order of channel_names
         """
         if not channel_names:
             raise ValueError("Channel list cannot be empty")
 
         days = days or self.config.parsing.default_days
+
+        if len(channel_names) < self.config.network.async_threshold:
+            return self._parse_multiple_channels_sequential(channel_names, days)
+
+        return self._parse_multiple_channels_concurrent(channel_names, days)
+
+    def _parse_multiple_channels_sequential(
+        self, channel_names: list[str], days: int
+    ) -> dict[str, Channel]:
+        """Parse channels one by one (used for batches below async_threshold)."""
+        total = len(channel_names)
         results = {}
 
-        self.logger.info(f"Starting to parse {len(channel_names)} channels")
+        self.logger.info(f"Starting to parse {total} channels")
 
-        progress = ProgressLogger(self.logger, len(channel_names), "Parsing channels")
+        progress = ProgressLogger(self.logger, total, "Parsing channels")
 
         for i, channel_name in enumerate(channel_names, 1):
             try:
-                self.logger.info(f"[{i}/{len(channel_names)}] Parsing @{channel_name}")
+                self.logger.info(f"[{i}/{total}] Parsing @{channel_name}")
+                results[channel_name] = self.parse_channel(channel_name, days)
+            except Exception as e:
+                self.logger.error(f"Error parsing @{channel_name}: {e}")
+            progress.update()
 
-                channel = self.parse_channel(channel_name, days)
-                results[channel_name] = channel
+        progress.finish()
+        self.logger.info(f"Parsing completed. Processed {len(results)} out of {total} channels")
 
-                progress.update()
+        return results
 
-                if i < len(channel_names):
-                    delay = 1.0 / self.config.network.requests_per_second
-                    self.logger.debug(f"Pause {delay:.1f}s before next channel")
-                    time.sleep(delay)
+    def _parse_multiple_channels_concurrent(
+        self, channel_names: list[str], days: int
+    ) -> dict[str, Channel]:
+        """Parse channels in a thread pool, limiting the number of channels in flight."""
+        total = len(channel_names)
+        self.logger.info(f"Starting to parse {total} channels")
 
-            except Exception as e:
-                self.logger.error(f"Error parsing @{channel_name}: {e}")
-                continue
+        progress = ProgressLogger(self.logger, total, "Parsing channels")
+        parsed: dict[str, Channel] = {}
+
+        def parse_one(index: int, channel_name: str) -> Channel:
+            self.logger.info(f"[{index}/{total}] Parsing @{channel_name}")
+            return self.parse_channel(channel_name, days)
+
+        with ThreadPoolExecutor(max_workers=self._channel_concurrency()) as executor:
+            futures = {
+                executor.submit(parse_one, i, channel_name): channel_name
+                for i, channel_name in enumerate(channel_names, 1)
+            }
+
+            # Results are collected on this thread, so progress needs no locking
+            for future in as_completed(futures):
+                channel_name = futures[future]
+                try:
+                    parsed[channel_name] = future.result()
+                except Exception as e:
+                    self.logger.error(f"Error parsing @{channel_name}: {e}")
+                progress.update()
+
+        results = {name: parsed[name] for name in channel_names if name in parsed}
 
         progress.finish()
-        self.logger.info(
-            f"Parsing completed. Processed {len(results)} out of {len(channel_names)} channels"
-        )
+        self.logger.info(f"Parsing completed. Processed {len(results)} out of {total} channels")
 
         return results
 
+    def _channel_concurrency(self) -> int:
+        """Number of channels parsed at the same time."""
+        max_workers = self.config.network.max_workers
+        if max_workers is not None:
+            return max_workers
+        return max(1, math.ceil(self.config.network.requests_per_second))
+
+    def _load_channel_info(self, channel_name: str) -> ChannelInfo:
+        """Get channel info and age, reusing the on-disk cache when enabled."""
+        fetch_age_info = self.config.parsing.fetch_age_info
+        ttl = self.config.parsing.info_cache_ttl
+
+        if self.info_cache is not None and ttl is not None:
+            cached = self.info_cache.get(channel_name, ttl)
+            # Entries cached without age info can't serve a run that needs it
+            if cached is not None and (not fetch_age_info or cached.get("first_post_date")):
+                self.logger.debug(f"Using cached info for @{channel_name}")
+                return ChannelInfo.from_dict(cached)
+
+        channel_info = self._get_channel_info(channel_name)
+        if fetch_age_info:
+            self._get_channel_age_info(channel_info)
+
+        if self.info_cache is not None:
+            self.info_cache.set(channel_name, channel_info.to_dict())
+
+        return channel_info
+
     def _get_channel_info(self, channel_name: str) -> ChannelInfo:
         """Get basic channel information."""
         url = f"{self.config.parsing.base_url}/{channel_name}"
 
         try:
             response = self._make_request("GET", url)
-            soup = BeautifulSoup(response.text, "html.parser")
+            soup = BeautifulSoup(response.content, "lxml")
 
             title_elem = soup.find("div", {"class": "tgme_page_title"})
             if not title_elem:
@@ -206,43 +491,79 @@ class TelegramParser:
         """
         Parse numbers with suffixes (K, M) and without them.
 
+        Plain integers ("534") and compact counts ("1.2K") are converted
+        directly. Other text is scanned once: digits and the decimal point
+        are collected, anything else (such as thousands separators) is
+        skipped, and K/M only count as a suffix right after a digit (so
+        "1,234 members" isn't read as millions).
+
         Args:
             text: Text containing number (e.g.: "1.2K", "5M", "1234")
 
         Returns:
             Number as int
         """
-        if not text:
+        if text.isdecimal():
+            return int(text)
+
+        multiplier = SUFFIX_MULTIPLIERS.get(text[-1:], 1)
+        compact = text[:-1] if multiplier > 1 else text
+        if compact[:1].isdigit():
+            try:
+                return int(float(compact) * multiplier)
+            except (ValueError, OverflowError):
+                pass
+
+        digits: list[str] = []
+        multiplier = 1
+        after_number = False
+
+        for char in text:
+            if "0" <= char <= "9" or char == ".":
+                digits.append(char)
+                after_number = True
+            else:
+                if after_number and char in SUFFIX_MULTIPLIERS:
+                    multiplier = SUFFIX_MULTIPLIERS[char]
+                after_number = False
+
+        if not digits:
             return 0
 
-        text = text.strip().upper()
+        try:
+            return int(float("".join(digits)) * multiplier)
+        except ValueError:
+            return 0
 
-        if "K" in text:
-            number = float(VIEWS_CLEANUP_REGEX.sub("", text.replace("K", "")))
-            return int(number * K_MULTIPLIER)
-        elif "M" in text:
-            number = float(VIEWS_CLEANUP_REGEX.sub("", text.replace("M", "")))
-            return int(number * M_MULTIPLIER)
-        else:
-            clean_text = NUMBER_CLEANUP_REGEX.sub("", text)
-            if clean_text:
+    def _unescape_html_content(self, html_content: str | bytes) -> str:
+        """
+        Unescape HTML content from JSON.
+
+        Accepts the raw response body, so the JSON parser decodes the UTF-8
+        bytes in the same pass instead of requests guessing their charset.
+        """
+        if isinstance(html_content, bytes):
+            if html_content.startswith(b'"') and html_content.endswith(b'"'):
                 try:
-                    return int(float(clean_text.replace(",", "")))
+                    return html.unescape(json_utils.loads(html_content))
                 except ValueError:
-                    return 0
-
-        return 0
+                    pass
+            text = html_content.decode("utf-8", errors="replace")
+        else:
+            text = html_content
 
-    def _unescape_html_content(self, html_content: str) -> str:
-        """Unescape HTML content from JSON."""
-        if html_content.startswith('"') and html_content.endswith('"'):
-            html_content = html_content[1:-1]
+        if text.startswith('"') and text.endswith('"'):
+            # The posts endpoint returns the page as a JSON string; decoding
+            # it handles every escape (including \\uXXXX) in one C-level call
+            try:
+                text = json_utils.loads(text)
+            except ValueError:
+                text = text[1:-1].replace('\\"', '"').replace("\\/", "/")
 
-        html_content = html_content.replace('\\"', '"').replace("\\/", "/")
-        return html.unescape(html_content)
+        return html.unescape(text)
 
     def _parse_posts_from_html(
-        self, html_content: str, channel_name: str
+        self, html_content: str | bytes, channel_name: str
     ) -> tuple[list[Post], str | None]:
         """
         Parse posts from HTML content.
@@ -250,39 +571,94 @@ class TelegramParser:
         Returns:
             tuple: (list of posts, before value for next request or None)
         """
+        post_elements, next_before = self._load_posts_page(html_content)
+        return self._parse_post_elements(post_elements, channel_name), next_before
+
+    def _load_posts_page(
+        self, html_content: str | bytes
+    ) -> tuple[list[lxml_html.HtmlElement], str | None]:
+        """
+        Parse posts page HTML without converting the posts yet.
+
+        Returns:
+            tuple: (post elements, before value for next request or None)
+        """
         if not html_content or not html_content.strip():
             return [], None
 
         html_content = self._unescape_html_content(html_content)
-        soup = BeautifulSoup(html_content, "html.parser")
+        try:
+            tree = lxml_html.document_fromstring(html_content)
+        except etree.ParserError:
+            # Nothing but whitespace or comments: the channel has no more posts
+            return [], None
 
-        post_elements = soup.find_all("div", {"class": "tgme_widget_message"})
+        post_elements = SELECT_POSTS(tree)
         self.logger.debug(f"Found {len(post_elements)} post elements in HTML")
 
+        next_before = None
+        more_hrefs = SELECT_MORE_LINK_HREF(tree)
+        if more_hrefs:
+            next_before = self._extract_before(more_hrefs[0])
+
+        return post_elements, next_before
+
+    def _parse_post_elements(
+        self,
+        post_elements: list[lxml_html.HtmlElement],
+        channel_name: str,
+        cutoff_date: datetime | None = None,
+    ) -> list[Post]:
+        """
+        Convert post elements of a page to posts, skipping broken ones.
+
+        Pages list posts in chronological order, so elements are consumed
+        newest first and conversion stops at the first post older than
+        cutoff_date: that post is kept with only its ID and date to mark the
+        cutoff, and the older elements above it are never touched.
+
+        Returns:
+            Posts in page (chronological) order
+        """
         posts = []
-        for elem in post_elements:
+        for elem in reversed(post_elements):
             try:
-                post = self._parse_single_post(elem, channel_name)
-                if post:
-                    posts.append(post)
-                else:
-                    self.logger.debug("Failed to parse post element - returned None")
+                post = self._parse_single_post(elem, channel_name, cutoff_date)
             except Exception as e:
                 self.logger.debug(f"Error parsing post: {e}")
                 continue
 
-        next_before = None
-        more_wrap = soup.find("div", {"class": "js-messages_more_wrap"})
-        if more_wrap and hasattr(more_wrap, "find") and isinstance(more_wrap, Tag):
-            more_link = more_wrap.find("a", {"class": "js-messages_more"})
-            if more_link and hasattr(more_link, "get") and isinstance(more_link, Tag):
-                href = more_link.get("href")
-                if isinstance(href, str):
-                    match = BEFORE_REGEX.search(href)
-                    if match:
-                        next_before = match.group(1)
-
-        return posts, next_before
+            if not post:
+                self.logger.debug("Failed to parse post element - returned None")
+                continue
+
+            posts.append(post)
+            if cutoff_date and post.date and post.date < cutoff_date:
+                break
+
+        posts.reverse()
+        return posts
+
+    def _should_prefetch(
+        self, post_elements: list[lxml_html.HtmlElement], cutoff_date: datetime, collected: int
+    ) -> bool:
+        """
+        Predict whether pagination continues past a page before its posts are parsed.
+
+        Mirrors the stop conditions of _get_posts: the post limit would be
+        reached, or even the newest post on the page is older than the cutoff.
+        """
+        max_posts = self.config.parsing.max_posts
+        if not post_elements or (max_posts and collected + len(post_elements) >= max_posts):
+            return False
+
+        # Posts are in chronological order, so the newest one is last
+        time_elem = post_elements[-1].find(".//time[@datetime]")
+        if time_elem is None:
+            return False
+
+        newest_date = parse_date(time_elem.get("datetime"))
+        return newest_date is not None and newest_date >= cutoff_date
 
     def _get_posts(self, channel_name: str, days: int) -> tuple[list[Post], int | None]:
         """
@@ -293,6 +669,9 @@ class TelegramParser:
         - If no link - reached end of channel
         - No manual before value calculations needed
 
+        While a page is converted to posts, the next page is already being
+        downloaded when pagination is expected to continue.
+
         Returns:
             Tuple of (posts list, latest post ID from first batch)
         """
@@ -309,102 +688,135 @@ class TelegramParser:
         url = f"{self.config.parsing.base_url}/s/{channel_name}"
         first_request = True
 
-        while first_request or before:
-            self.logger.debug(f"Loop iteration: first_request={first_request}, before={before}")
-            first_request = False
+        # Single-slot prefetch of the next page
+        next_page: Future[requests.Response] | None = None
 
-            if max_posts and len(all_posts) >= max_posts:
-                self.logger.info(f"Post limit reached: {max_posts}")
-                break
-
-            data: dict[str, str] = {}
-            if before:
-                data["before"] = before
-
-            try:
-                self.logger.debug(f"Request to {url} with params: {data}")
-                response = self._make_request("POST", url, data=data)
-                self.logger.debug(f"Response size: {len(response.text)} bytes")
+        with ThreadPoolExecutor(max_workers=1) as prefetcher:
+            while first_request or before:
+                self.logger.debug(f"Loop iteration: first_request={first_request}, before={before}")
+                first_request = False
 
-                batch_posts, next_before = self._parse_posts_from_html(response.text, channel_name)
-
-                if not batch_posts:
-                    self.logger.debug("Empty batch received - no more posts available")
+                if max_posts and len(all_posts) >= max_posts:
+                    self.logger.info(f"Post limit reached: {max_posts}")
                     break
 
-                if latest_post_id is None and batch_posts:
-                    latest_post_id_str = batch_posts[0].post_id
-                    # Convert string post_id to int
-                    try:
-                        latest_post_id = int(latest_post_id_str) if latest_post_id_str else None
-                    except (ValueError, TypeError):
-                        latest_post_id = None
-                    self.logger.debug(f"Latest post ID: {latest_post_id}")
-
-                valid_posts = []
-                found_old_post = False
-
-                for post in reversed(batch_posts):
-                    post_date = parse_date(post.date)
-
-                    if post_date and post_date >= cutoff_date:
-                        valid_posts.append(post)
-
-                        if max_posts and len(all_posts) + len(valid_posts) >= max_posts:
-                            posts_needed = max_posts - len(all_posts)
-                            valid_posts = valid_posts[:posts_needed]
-                            next_before = None
-                            break
+                try:
+                    if next_page is not None:
+                        response = next_page.result()
+                        next_page = None
                     else:
-                        found_old_post = True
-                        self.logger.debug(
-                            f"Post {post.post_id} older than cutoff_date: {post_date} < {cutoff_date}"
+                        data: dict[str, str] = {}
+                        if before:
+                            data["before"] = before
+
+                        self.logger.debug(f"Request to {url} with params: {data}")
+                        response = self._make_request("POST", url, data=data)
+                    self.logger.debug(f"Response size: {len(response.content)} bytes")
+
+                    post_elements, next_before = self._load_posts_page(response.content)
+                    if next_before and self._should_prefetch(
+                        post_elements, cutoff_date, len(all_posts)
+                    ):
+                        self.logger.debug(f"Prefetching next batch, before: {next_before}")
+                        next_page = prefetcher.submit(
+                            self._make_request, "POST", url, data={"before": next_before}
                         )
 
-                all_posts.extend(valid_posts)
-
-                self.logger.debug(
-                    f"Processed batch: {len(batch_posts)} posts, valid: {len(valid_posts)}, total collected: {len(all_posts)}"
-                )
-
-                if found_old_post and len(valid_posts) == 0:
-                    self.logger.debug(
-                        "All posts in batch are older than cutoff date - stopping pagination"
+                    batch_posts = self._parse_post_elements(
+                        post_elements, channel_name, cutoff_date
                     )
-                    break
+                    if not batch_posts:
+                        self.logger.debug("Empty batch received - no more posts available")
+                        break
+
+                    if latest_post_id is None and batch_posts:
+                        latest_post_id_str = batch_posts[0].post_id
+                        # Convert string post_id to int
+                        try:
+                            latest_post_id = int(latest_post_id_str) if latest_post_id_str else None
+                        except (ValueError, TypeError):
+                            latest_post_id = None
+                        self.logger.debug(f"Latest post ID: {latest_post_id}")
+
+                    valid_posts = []
+                    found_old_post = False
+                    # Posts still allowed by the limit, counted down per valid post
+                    remaining = max_posts - len(all_posts) if max_posts else None
+
+                    for post in reversed(batch_posts):
+                        post_date = post.date  # Parsed once in _parse_single_post
+
+                        if post_date and post_date >= cutoff_date:
+                            valid_posts.append(post)
+
+                            if remaining is not None:
+                                remaining -= 1
+                                if remaining <= 0:
+                                    next_before = None
+                                    break
+                        else:
+                            found_old_post = True
+                            self.logger.debug(
+                                f"Post {post.post_id} older than cutoff_date: {post_date} < {cutoff_date}"
+                            )
+
+                    all_posts.extend(valid_posts)
 
-                if next_before is None:
                     self.logger.debug(
-                        "Telegram didn't provide next page link - reached end of channel or pagination"
+                        f"Processed batch: {len(batch_posts)} posts, valid: {len(valid_posts)}, total collected: {len(all_posts)}"
                     )
-                    break
 
-                before = next_before
-                self.logger.debug(f"Moving to next batch, before: {before}")
+                    if found_old_post and len(valid_posts) == 0:
+                        self.logger.debug(
+                            "All posts in batch are older than cutoff date - stopping pagination"
+                        )
+                        break
 
-                time.sleep(1.0 / self.config.network.requests_per_second)
+                    if next_before is None:
+                        self.logger.debug(
+                            "Telegram didn't provide next page link - reached end of channel or pagination"
+                        )
+                        break
 
-            except requests.RequestException as e:
-                self.logger.error(f"Error loading posts: {e}")
-                if all_posts:
-                    self.logger.warning(f"Returning {len(all_posts)} posts collected before error")
-                    break
-                raise ValueError(f"Failed to get posts for @{channel_name}: {e}") from e
+                    before = next_before
+                    self.logger.debug(f"Moving to next batch, before: {before}")
 
-        # Sort posts by date, filtering out posts with None dates
-        all_posts_with_dates = [post for post in all_posts if post.date is not None]
-        all_posts_with_dates.sort(key=lambda p: cast(datetime, p.date))
-        all_posts = all_posts_with_dates
+                except requests.RequestException as e:
+                    self.logger.error(f"Error loading posts: {e}")
+                    if all_posts:
+                        self.logger.warning(
+                            f"Returning {len(all_posts)} posts collected before error"
+                        )
+                        break
+                    raise ValueError(f"Failed to get posts for @{channel_name}: {e}") from e
+
+            if next_page is not None:
+                # Pagination stopped early after all; drop the request if not started
+                next_page.cancel()
+
+        # Pages arrive from newest to oldest and each one is walked newest
+        # first, so the collected (all dated) posts are in descending date
+        # order already: reversing them replaces a sort
+        all_posts.reverse()
 
         if max_posts and len(all_posts) > max_posts:
             all_posts = all_posts[:max_posts]
 
         return all_posts, latest_post_id
 
-    def _parse_single_post(self, post_elem: Tag, channel_name: str) -> Post | None:
-        """Parse single post from HTML element."""
-        post_id_raw = post_elem.get("data-post", "")
-        post_id_full = post_id_raw if isinstance(post_id_raw, str) else ""
+    def _parse_single_post(
+        self,
+        post_elem: lxml_html.HtmlElement,
+        channel_name: str,
+        cutoff_date: datetime | None = None,
+    ) -> Post | None:
+        """
+        Parse single post from HTML element.
+
+        Posts older than cutoff_date are only going to be discarded, so
+        their text and views are not extracted.
+        """
+        post_id_full = post_elem.get("data-post") or ""
 
         if not post_id_full:
             self.logger.debug("No data-post attribute found")
@@ -415,33 +827,31 @@ class TelegramParser:
             self.logger.debug(f"Failed to extract numeric ID from: {post_id_full}")
             return None
 
-        date_elem = post_elem.find("time", {"datetime": True})
-        if not date_elem or not hasattr(date_elem, "get"):
+        fields = self._find_post_fields(post_elem)
+
+        date_elem = fields.get("date")
+        if date_elem is None:
             self.logger.debug(f"No time element with datetime attribute found for post {post_id}")
             return None
 
-        datetime_str = date_elem.get("datetime", "")
-        if not datetime_str or not isinstance(datetime_str, str):
-            self.logger.debug(
-                f"No datetime attribute for post {post_id}. Time element: {date_elem}"
-            )
+        datetime_str = date_elem.get("datetime")
+        if not datetime_str:
             self.logger.debug(
-                f"Time element attrs: {date_elem.attrs if hasattr(date_elem, 'attrs') else 'no attrs'}"
+                f"No datetime attribute for post {post_id}. Time element attrs: "
+                f"{dict(date_elem.attrib)}"
             )
             return None
 
         post_date = parse_date(datetime_str)
+        if cutoff_date and post_date and post_date < cutoff_date:
+            return Post(post_id=str(post_id), date=post_date)
 
-        author_elem = post_elem.find("span", {"class": "tgme_widget_message_author_name"})
-        author = author_elem.get_text(strip=True) if author_elem else channel_name
-
-        text_elem = post_elem.find("div", {"class": "tgme_widget_message_text"})
-        raw_text = ""
-        if text_elem:
-            raw_text = str(text_elem)
+        author_elem = fields.get("author")
+        author = author_elem.text_content().strip() if author_elem is not None else channel_name
 
-        text = self._html_to_markdown(raw_text)
-        views = self._extract_views(post_elem)
+        text_elem = fields.get("text")
+        text = self._element_to_markdown(text_elem) if text_elem is not None else ""
+        views = self._extract_views(fields.get("views"))
 
         return Post(
             post_id=str(post_id),
@@ -451,50 +861,80 @@ class TelegramParser:
             text=text.strip(),
         )
 
-    def _extract_views(self, post_elem: Tag) -> int:
+    def _find_post_fields(
+        self, post_elem: lxml_html.HtmlElement
+    ) -> dict[str, lxml_html.HtmlElement]:
+        """
+        Locate post date, author, text and views elements in one pass.
+
+        Returns:
+            First matching element for each of "date", "author", "text", "views"
+        """
+        fields: dict[str, lxml_html.HtmlElement] = {}
+        for elem in post_elem.iter("time", "span", "div"):
+            if elem.tag == "time":
+                if elem.get("datetime") is not None:
+                    fields.setdefault("date", elem)
+                continue
+
+            for class_name in (elem.get("class") or "").split():
+                field_name = POST_FIELD_CLASSES.get(class_name)
+                if field_name:
+                    fields.setdefault(field_name, elem)
+                    break
+
+        return fields
+
+    def _extract_views(self, views_elem: lxml_html.HtmlElement | None) -> int:
         """Extract post view count."""
-        views_elem = post_elem.find("span", {"class": "tgme_widget_message_views"})
-        if not views_elem:
+        if views_elem is None:
             return 0
 
-        views_text = views_elem.get_text(strip=True)
+        views_text = views_elem.text_content().strip()
         return self._parse_number_with_suffix(views_text)
 
+    def _element_to_markdown(self, elem: lxml_html.HtmlElement) -> str:
+        """Convert parsed post text element to Markdown."""
+        if self.config.parsing.html2text_markdown:
+            html_content = lxml_html.tostring(elem, encoding="unicode", with_tail=False)
+            return self._html_to_markdown(html_content)
+
+        return _fast_html_to_md(elem)
+
     def _html_to_markdown(self, html_content: str) -> str:
-        """Convert HTML to Markdown using html2text."""
+        """Convert HTML to Markdown (with html2text in high-fidelity mode)."""
         if not html_content:
             return ""
 
         try:
-            markdown = self.html_converter.handle(html_content)
-
-            lines = [line.strip() for line in markdown.split("\n")]
-            lines = [line for line in lines if line]
-
-            result = "\n".join(lines)
+            if self.config.parsing.html2text_markdown:
+                return _convert_html(html_content)
 
-            return result.strip()
+            return _fast_html_to_md(
+                lxml_html.fragment_fromstring(html_content, create_parent="div")
+            )
         except Exception as e:
             self.logger.warning(f"Error converting HTML to Markdown: {e}")
-            soup = BeautifulSoup(html_content, "html.parser")
+            soup = BeautifulSoup(html_content, "lxml")
             return soup.get_text(separator=" ", strip=True)
 
-    def _get_channel_age_info(self, channel_info: ChannelInfo, _latest_post_id: int | None) -> None:
+    def _get_channel_age_info(self, channel_info: ChannelInfo) -> None:
         """Get channel age information and set first_post_date in channel_info."""
         try:
-            posts = self._get_earliest_posts(channel_info.channel)
-            if posts:
-                # Filter posts with valid dates
-                posts_with_dates = [post for post in posts if post.date is not None]
-                if posts_with_dates:
-                    first_post = min(posts_with_dates, key=lambda p: cast(datetime, p.date))
-                    channel_info.first_post_date = first_post.date
+            dates = self._get_earliest_post_dates(channel_info.channel)
+            if dates:
+                channel_info.first_post_date = min(dates)
 
         except Exception as e:
             self.logger.debug(f"Error getting age info: {e}")
 
-    def _get_earliest_posts(self, channel_name: str) -> list[Post]:
-        """Get earliest channel posts."""
+    def _get_earliest_post_dates(self, channel_name: str) -> list[datetime]:
+        """
+        Get dates of the earliest channel posts.
+
+        Only the dates are needed, so they are read from the page with a
+        single regex scan instead of building the DOM and converting posts.
+        """
         url = f"{self.config.parsing.base_url}/s/{channel_name}"
         data = {"before": str(EARLIEST_POST_ID)}
 
@@ -502,36 +942,51 @@ class TelegramParser:
 
         try:
             response = self._make_request("POST", url, data=data)
-            posts, _ = self._parse_posts_from_html(response.text, channel_name)
-            limit = max(1, self.config.parsing.age_posts_limit)
-            return posts[:limit]
-        except (requests.RequestException, ValueError, AttributeError) as e:
+        except requests.RequestException as e:
             self.logger.debug(f"Error getting early posts: {e}")
             return []
 
+        html_content = self._unescape_html_content(response.content)
+        limit = max(1, self.config.parsing.age_posts_limit)
+
+        # A page holds a few dozen posts, so all their dates are parsed in one batch
+        dates = parse_dates(POST_TIME_REGEX.findall(html_content))
+        return [post_date for post_date in dates if post_date][:limit]
+
     def _extract_numeric_id(self, post_id: str) -> int | None:
-        """Extract numeric part from post_id."""
+        """Extract numeric part from post_id ("channel/123")."""
         if not post_id:
             return None
-        try:
-            parts = post_id.split("/")
-            if len(parts) >= POST_ID_PARTS_COUNT and parts[-1].isdigit():
-                return int(parts[-1])
-            return None
-        except (AttributeError, IndexError, ValueError):
+
+        _, separator, number = post_id.rpartition("/")
+        if separator and number.isdecimal():
+            return int(number)
+        return None
+
+    def _extract_before(self, href: str) -> str | None:
+        """Extract the before=<digits> value from a pagination link."""
+        _, found, tail = href.partition("before=")
+        if not found:
             return None
 
+        digits = tail[: len(tail) - len(tail.lstrip(string.digits))]
+        return digits or None
+
     def _make_request(
         self, method: str, url: str, data: dict[str, Any] | None = None, **kwargs: Any
     ) -> requests.Response:
         """Make HTTP request with retry logic."""
         for attempt in range(self.config.network.retry_attempts):
+            self.rate_limiter.acquire()
             try:
                 response = self.session.request(
                     method=method,
                     url=url,
                     data=data,
-                    timeout=self.config.network.request_timeout,
+                    timeout=(
+                        self.config.network.connect_timeout,
+                        self.config.network.request_timeout,
+                    ),
                     **kwargs,
                 )
                 response.raise_for_status()
@@ -3,11 +3,11 @@
 from dataclasses import dataclass, field
 from datetime import datetime
 
-from ..utils import datetime_to_str
+from ..utils import datetime_to_str, parse_date
 from .post import Post
 
 
-@dataclass
+@dataclass(slots=True)
 class ChannelInfo:
     """Channel information."""
 
@@ -24,8 +24,30 @@ class ChannelInfo:
             return (datetime.now() - self.first_post_date).days
         return 0
 
+    def to_dict(self) -> dict:
+        """Convert channel info to dictionary."""
+        return {
+            "channel": self.channel,
+            "name": self.name,
+            "subscribers": self.subscribers,
+            "description": self.description,
+            "first_post_date": datetime_to_str(self.first_post_date),
+            "channel_age_days": self.channel_age_days,
+        }
 
-@dataclass
+    @classmethod
+    def from_dict(cls, data: dict) -> "ChannelInfo":
+        """Create channel info from dictionary produced by to_dict()."""
+        return cls(
+            channel=data.get("channel", ""),
+            name=data.get("name", ""),
+            subscribers=data.get("subscribers", 0),
+            description=data.get("description", ""),
+            first_post_date=parse_date(data.get("first_post_date")),
+        )
+
+
+@dataclass(slots=True)
 class Channel:
     """Telegram channel model."""
 
@@ -55,13 +77,14 @@ class Channel:
     def to_dict(self) -> dict:
         """Convert channel to dictionary."""
         return {
-            "info": {
-                "channel": self.info.channel,
-                "name": self.info.name,
-                "subscribers": self.info.subscribers,
-                "description": self.info.description,
-                "first_post_date": datetime_to_str(self.info.first_post_date),
-                "channel_age_days": self.info.channel_age_days,
-            },
+            "info": self.info.to_dict(),
             "posts": [post.to_dict() for post in self.posts],
         }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Channel":
+        """Create channel from dictionary produced by to_dict()."""
+        return cls(
+            info=ChannelInfo.from_dict(data.get("info", {})),
+            posts=[Post.from_dict(post) for post in data.get("posts", [])],
+        )
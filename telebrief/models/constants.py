@@ -12,13 +12,12 @@ HIGH_FREQUENCY_THRESHOLD = 3.0
 MEDIUM_FREQUENCY_THRESHOLD = 1.0
 LOW_FREQUENCY_THRESHOLD = 0.5
 
-POST_ID_PARTS_COUNT = 2
-
 EARLIEST_POST_ID = 2
 DEFAULT_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
 
 PERCENTILE_90 = 0.9
 PERCENTILE_75 = 0.75
+PERCENTILE_50 = 0.5
 
 MIN_VALUES_FOR_GINI = 2
 TOP_POSTS_PERCENTAGE = 10
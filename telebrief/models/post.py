@@ -3,8 +3,10 @@
 from dataclasses import dataclass
 from datetime import datetime
 
+from ..utils import parse_date
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class Post:
     """Telegram post model."""
 
@@ -28,3 +30,14 @@ class Post:
             "author": self.author,
             "text": self.text,
         }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Post":
+        """Create post from dictionary produced by to_dict()."""
+        return cls(
+            post_id=data.get("post_id"),
+            views=data.get("views", 0),
+            date=parse_date(data.get("date")),
+            author=data.get("author", ""),
+            text=data.get("text", ""),
+        )
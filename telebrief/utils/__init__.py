@@ -5,7 +5,8 @@ Contains helper modules for configuration, logging and other tasks.
 """
 
 from .config import Config, NetworkConfig, ParsingConfig
-from .date_utils import datetime_to_str, parse_date
+from .date_utils import datetime_to_str, parse_date, parse_dates
+from .infocache import InfoCache
 from .logger import (
     ColoredFormatter,
     ProgressLogger,
@@ -13,16 +14,20 @@ from .logger import (
     get_logger,
     setup_logger,
 )
+from .ratelimit import TokenBucket
 
 __all__ = [
     "ColoredFormatter",
     "Config",
+    "InfoCache",
     "NetworkConfig",
     "ParsingConfig",
     "ProgressLogger",
+    "TokenBucket",
     "configure_external_loggers",
     "datetime_to_str",
     "get_logger",
     "parse_date",
+    "parse_dates",
     "setup_logger",
 ]
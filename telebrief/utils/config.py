@@ -2,8 +2,11 @@
 Configuration system for Telebrief.
 """
 
-import os
-from dataclasses import dataclass, field
+import sys
+from dataclasses import asdict, dataclass, field
+from functools import lru_cache
+
+from . import json_utils
 
 MAX_PORT_NUMBER = 65535
 MIN_PORT_NUMBER = 1
@@ -15,7 +18,18 @@ MIN_REQUEST_RATE = 0.1
 MAX_REQUEST_RATE = 100.0
 
 
-@dataclass
+@lru_cache(maxsize=1024)
+def _clean_channel_name(channel: str) -> str:
+    """
+    Cleans channel name from extra characters.
+
+    Results are cached and interned: the same channel lists are cleaned
+    over and over, and configs listing a channel share its name.
+    """
+    return sys.intern(channel.strip().lower().removeprefix("@"))
+
+
+@dataclass(slots=True)
 class NetworkConfig:
     """Network interaction configuration."""
 
@@ -26,10 +40,19 @@ class NetworkConfig:
     verify_ssl: bool = False
 
     request_timeout: int = 30
+    connect_timeout: float = 5.0
     retry_attempts: int = 3
     retry_delay: float = 1.0
 
     requests_per_second: float = 1.0
+    # Requests that may be sent back to back before the rate limit kicks in
+    burst: int = 1
+
+    # Batches smaller than this are parsed sequentially: for a couple of
+    # channels the worker threads cost more than they save
+    async_threshold: int = 4
+    # Channels parsed at the same time (None: one per request per second)
+    max_workers: int | None = None
 
     def __post_init__(self) -> None:
         """Parameter validation after initialization."""
@@ -39,6 +62,9 @@ class NetworkConfig:
         if self.request_timeout < MIN_TIMEOUT or self.request_timeout > MAX_TIMEOUT:
             raise ValueError(f"Timeout must be between {MIN_TIMEOUT} and {MAX_TIMEOUT}")
 
+        if self.connect_timeout <= 0:
+            raise ValueError("Connect timeout must be positive")
+
         if self.retry_attempts < MIN_RETRY_ATTEMPTS or self.retry_attempts > MAX_RETRY_ATTEMPTS:
             raise ValueError(
                 f"Number of attempts must be between {MIN_RETRY_ATTEMPTS} and {MAX_RETRY_ATTEMPTS}"
@@ -52,6 +78,15 @@ class NetworkConfig:
                 f"Request rate must be between {MIN_REQUEST_RATE} and {MAX_REQUEST_RATE}"
             )
 
+        if self.burst < 1:
+            raise ValueError("Burst must be at least 1")
+
+        if self.async_threshold < 1:
+            raise ValueError("Async threshold must be at least 1")
+
+        if self.max_workers is not None and self.max_workers < 1:
+            raise ValueError("Max workers must be at least 1")
+
     @property
     def proxy_url(self) -> str | None:
         """Returns proxy URL."""
@@ -68,7 +103,7 @@ class NetworkConfig:
         return {"http": proxy_url, "https": proxy_url} if proxy_url else None
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsingConfig:
     """Channel parsing configuration."""
 
@@ -80,12 +115,22 @@ class ParsingConfig:
     fetch_age_info: bool = True
     age_posts_limit: int = 5
 
+    # Convert post text with html2text: full Markdown fidelity, several
+    # times slower than the built-in converter
+    html2text_markdown: bool = False
+
+    # Seconds to reuse cached channel info / parsed posts
+    # (None disables the cache, 0 refreshes it)
+    info_cache_ttl: int | None = None
+    post_cache_ttl: int | None = None
 
-@dataclass
+
+@dataclass(slots=True)
 class Config:
     """Application configuration."""
 
     output_dir: str = "output"
+    cache_dir: str = "cache"
     log_level: str = "INFO"
 
     network: NetworkConfig = field(default_factory=NetworkConfig)
@@ -102,13 +147,13 @@ class Config:
 
     def __post_init__(self) -> None:
         """Validation and additional processing after initialization."""
-        os.makedirs(self.output_dir, exist_ok=True)
-        self.channels = [self._clean_channel_name(ch) for ch in self.channels]
+        # Deduplicated in their original order
+        self.channels = list(dict.fromkeys(map(_clean_channel_name, self.channels)))
         self.analysis_periods = sorted(set(self.analysis_periods))
 
     def _clean_channel_name(self, channel: str) -> str:
         """Cleans channel name from extra characters."""
-        return channel.strip().lstrip("@").lower()
+        return _clean_channel_name(channel)
 
     def add_channel(self, channel: str) -> None:
         """Adds channel to analysis list."""
@@ -124,30 +169,13 @@ class Config:
 
     def to_dict(self) -> dict:
         """Converts configuration to dictionary."""
-        return {
-            "network": {
-                "proxy_host": self.network.proxy_host,
-                "proxy_port": self.network.proxy_port,
-                "use_proxy": self.network.use_proxy,
-                "verify_ssl": self.network.verify_ssl,
-                "request_timeout": self.network.request_timeout,
-                "retry_attempts": self.network.retry_attempts,
-                "retry_delay": self.network.retry_delay,
-                "requests_per_second": self.network.requests_per_second,
-            },
-            "parsing": {
-                "base_url": self.parsing.base_url,
-                "default_days": self.parsing.default_days,
-                "max_posts_per_request": self.parsing.max_posts_per_request,
-                "max_posts": self.parsing.max_posts,
-                "fetch_age_info": self.parsing.fetch_age_info,
-                "age_posts_limit": self.parsing.age_posts_limit,
-            },
-            "channels": self.channels,
-            "output_dir": self.output_dir,
-            "output_format": self.output_format,
-            "include_metrics": self.include_metrics,
-            "analysis_periods": self.analysis_periods,
-            "log_level": self.log_level,
-            "log_to_file": self.log_to_file,
-        }
+        return asdict(self)
+
+    def to_json(self, indent: bool = False) -> bytes:
+        """
+        Serializes configuration to JSON.
+
+        With orjson the dataclasses are encoded directly, without building
+        the intermediate dictionary of to_dict().
+        """
+        return json_utils.dumps(self, indent=indent)
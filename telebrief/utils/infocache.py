@@ -0,0 +1,84 @@
+"""
+On-disk cache for channel information.
+"""
+
+import os
+import re
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from . import json_utils
+from .logger import get_logger
+
+# Cache files are named after the channel, so only plain usernames are accepted
+CACHE_KEY_REGEX = re.compile(r"\w+", re.ASCII)
+
+
+def cache_path(cache_dir: Path, channel: str) -> Path:
+    """
+    Path of the cache file for channel inside cache_dir.
+
+    Raises:
+        ValueError: If channel is not a plain username (it could point outside cache_dir)
+    """
+    if not CACHE_KEY_REGEX.fullmatch(channel):
+        raise ValueError(f"Invalid channel name for cache: {channel!r}")
+    return cache_dir / f"{channel.lower()}.json"
+
+
+def write_json_atomic(path: Path, data: Any) -> None:
+    """Write JSON to path atomically so readers never see a partial file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(json_utils.dumps(data))
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+class InfoCache:
+    """TTL cache of channel information stored as one JSON file per channel."""
+
+    def __init__(self, cache_dir: str | Path) -> None:
+        self.cache_dir = Path(cache_dir)
+        self.logger = get_logger(f"{__name__}.{self.__class__.__name__}")
+
+    def _path(self, channel: str) -> Path:
+        return cache_path(self.cache_dir, channel)
+
+    def get(self, channel: str, ttl: float) -> dict | None:
+        """
+        Return cached data for channel if it is younger than ttl seconds.
+
+        Args:
+            channel: Channel name
+            ttl: Maximum entry age in seconds
+
+        Returns:
+            Cached data or None on miss, expiry or unreadable entry
+        """
+        if ttl <= 0:
+            return None
+
+        try:
+            entry = json_utils.loads(self._path(channel).read_bytes())
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(entry, dict) or time.time() - entry.get("cached_at", 0) > ttl:
+            return None
+
+        data = entry.get("data")
+        return data if isinstance(data, dict) else None
+
+    def set(self, channel: str, data: dict) -> None:
+        """Store data for channel. Write failures are logged, not raised."""
+        try:
+            write_json_atomic(self._path(channel), {"cached_at": time.time(), "data": data})
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Failed to cache info for @{channel}: {e}")
@@ -0,0 +1,66 @@
+"""
+JSON helpers for Telebrief.
+
+Uses orjson when it is installed and falls back to the standard json module.
+"""
+
+import json
+from dataclasses import asdict, is_dataclass
+from datetime import date
+from typing import Any
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:  # pragma: no cover - depends on the environment
+    HAS_ORJSON = False
+
+
+def _default(obj: Any) -> Any:
+    """Serialize types orjson supports natively for the standard json fallback."""
+    if isinstance(obj, date):
+        return obj.isoformat()
+    if hasattr(obj, "tolist"):  # NumPy arrays and scalars
+        return obj.tolist()
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(data: Any, indent: bool = False) -> bytes:
+    """
+    Serialize data to UTF-8 encoded JSON.
+
+    Datetimes, NumPy values, dataclass instances and non-string dictionary
+    keys (such as period numbers) are accepted by both backends.
+
+    Args:
+        data: Object to serialize
+        indent: Pretty-print with two-space indentation
+
+    Returns:
+        JSON document as bytes
+    """
+    if HAS_ORJSON:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+
+    return json.dumps(
+        data, ensure_ascii=False, indent=2 if indent else None, default=_default
+    ).encode("utf-8")
+
+
+def loads(data: bytes | str) -> Any:
+    """
+    Deserialize JSON document.
+
+    Raises:
+        ValueError: If data is not valid JSON
+    """
+    if HAS_ORJSON:
+        return orjson.loads(data)
+
+    return json.loads(data)
@@ -5,8 +5,12 @@ Logging system for Telebrief.
 import logging
 import os
 import sys
-from logging.handlers import RotatingFileHandler
-from typing import ClassVar
+from collections.abc import Iterable
+from logging.handlers import MemoryHandler, RotatingFileHandler
+from typing import Any, ClassVar
+
+FILE_BUFFER_RECORDS = 1024  # Log records held in memory between file writes
+PROGRESS_STEP_PERCENT = 10  # ProgressLogger reports every this many percent
 
 
 class ColoredFormatter(logging.Formatter):
@@ -21,16 +25,162 @@ class ColoredFormatter(logging.Formatter):
         "RESET": "\033[0m",
     }
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        reset = self.COLORS["RESET"]
+        # Colored level names are built once and indexed by levelno // 10,
+        # from NOTSET (0) to CRITICAL (50); None leaves the name plain
+        colored: list[str | None] = []
+        for levelno in range(logging.NOTSET, logging.CRITICAL + 1, 10):
+            level = logging.getLevelName(levelno)
+            color = self.COLORS.get(level)
+            colored.append(f"{color}{level}{reset}" if color else None)
+        self._colored_by_levelno = tuple(colored)
+
     def format(self, record: logging.LogRecord) -> str:
+        levelno = record.levelno
+        # Custom levels between or above the standard ones stay uncolored
+        if levelno % 10 or not 0 <= levelno <= logging.CRITICAL:
+            return super().format(record)
+        colored = self._colored_by_levelno[levelno // 10]
+        if colored is None:
+            return super().format(record)
+
         levelname = record.levelname
-        if levelname in self.COLORS:
-            record.levelname = f"{self.COLORS[levelname]}{levelname}{self.COLORS['RESET']}"
+        record.levelname = colored
+        try:
+            return super().format(record)
+        finally:
+            # Other handlers receive the same record and must see the plain name
+            record.levelname = levelname
+
+
+class SizeTrackingFileHandler(RotatingFileHandler):
+    """
+    RotatingFileHandler that keeps count of the file size itself.
+
+    The stock handler seeks to the end of the file on every record to
+    decide on rollover, and formats the record a second time to write it.
+    """
+
+    def __init__(self, filename: str, *args: Any, **kwargs: Any) -> None:
+        super().__init__(filename, *args, **kwargs)
+        try:
+            self._size = os.path.getsize(self.baseFilename)
+        except OSError:
+            self._size = 0
+
+    def doRollover(self) -> None:  # noqa: N802 - overrides the logging API
+        super().doRollover()
+        self._size = 0
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self._write_records([record])
+
+    def emit_many(self, records: Iterable[logging.LogRecord]) -> None:
+        """
+        Write a batch of records with one write and one flush per log file.
+
+        Records are filtered like in handle(); the batch is only split where
+        it has to roll over to a new file.
+        """
+        with self.lock:  # type: ignore[union-attr]
+            self._write_records([r for r in records if r.levelno >= self.level and self.filter(r)])
+
+    def _write_records(self, records: list[logging.LogRecord]) -> None:
+        messages: list[str] = []
+        size = 0
+        for record in records:
+            try:
+                msg = self.format(record) + self.terminator
+            except RecursionError:
+                raise
+            except Exception:
+                self.handleError(record)
+                continue
+
+            msg_size = len(msg.encode(self.encoding or "utf-8", "replace"))
+            current = self._size + size
+            if self.maxBytes > 0 and current and current + msg_size > self.maxBytes:
+                self._write_batch(messages, size, record)
+                messages, size = [], 0
+                self.doRollover()
+            messages.append(msg)
+            size += msg_size
+
+        if messages:
+            self._write_batch(messages, size, records[-1])
+
+    def _write_batch(self, messages: list[str], size: int, record: logging.LogRecord) -> None:
+        if not messages:
+            return
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write("".join(messages))
+            self.flush()
+            self._size += size
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+class BufferedFileHandler(MemoryHandler):
+    """
+    MemoryHandler that hands its buffer to the file handler as one batch.
+
+    The stock flush() passes records on one at a time, so the file is still
+    written and flushed once per record.
+    """
+
+    def flush(self) -> None:
+        if not isinstance(self.target, SizeTrackingFileHandler):
+            super().flush()
+            return
+        with self.lock:  # type: ignore[union-attr]
+            self.target.emit_many(self.buffer)
+            self.buffer.clear()
 
-        return super().format(record)
+
+CONSOLE_FORMAT = "%(asctime)s | %(levelname)8s | %(name)s | %(message)s"
+FILE_FORMAT = "%(asctime)s | %(levelname)8s | %(name)s | %(filename)s:%(lineno)d | %(message)s"
+
+# Formatters hold no per-handler state, so every logger shares the same ones
+_CONSOLE_FORMATTER = ColoredFormatter(CONSOLE_FORMAT)
+_PLAIN_CONSOLE_FORMATTER = logging.Formatter(CONSOLE_FORMAT)
+_FILE_FORMATTER = logging.Formatter(FILE_FORMAT)
+
+LOG_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
+
+APP_LOGGER_NAME = "telebrief"
+# getLogger() always returns the same object for a name, so it is looked up once
+_app_logger = logging.getLogger(APP_LOGGER_NAME)
+
+# Parameters each logger was last set up with, by logger name
+_logger_params: dict[str, tuple[Any, ...]] = {}
+
+
+def _level_number(level: str) -> int:
+    """Converts a level name to its number, raising ValueError for unknown names."""
+    name = level.upper()
+    if name in LOG_LEVELS:
+        return LOG_LEVELS[name]
+    # Other names logging knows about, such as WARN and NOTSET
+    level_no = logging.getLevelName(name)
+    if isinstance(level_no, int):
+        return level_no
+    raise ValueError(f"Unknown log level: {level}. Valid levels: {', '.join(LOG_LEVELS)}")
 
 
 def setup_logger(
-    name: str = "telebrief",
+    name: str = APP_LOGGER_NAME,
     level: str = "INFO",
     log_to_file: bool = True,
     log_dir: str = "logs",
@@ -55,18 +205,31 @@ def setup_logger(
     """
 
     logger = logging.getLogger(name)
-    logger.setLevel(getattr(logging, level.upper()))
 
+    # Setting up a logger again with the same parameters keeps its handlers
+    params = (level, log_to_file, log_dir, console_output, max_file_size, backup_count)
+    if logger.handlers and _logger_params.get(name) == params:
+        return logger
+    level_no = _level_number(level)
+    _logger_params[name] = params
+    logger.setLevel(level_no)
+
+    # Closing flushes records still buffered for the previous log file
+    for handler in logger.handlers:
+        if isinstance(handler, MemoryHandler) and handler.target:
+            target = handler.target
+            handler.close()
+            target.close()
+        else:
+            handler.close()
     logger.handlers.clear()
 
-    console_format = "%(asctime)s | %(levelname)8s | %(name)s | %(message)s"
-    file_format = "%(asctime)s | %(levelname)8s | %(name)s | %(filename)s:%(lineno)d | %(message)s"
-
     if console_output:
         console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(getattr(logging, level.upper()))
-        console_formatter = ColoredFormatter(console_format)
-        console_handler.setFormatter(console_formatter)
+        console_handler.setLevel(level_no)
+        # Escape codes are only useful on a terminal and when NO_COLOR is not set
+        use_color = sys.stdout.isatty() and not os.environ.get("NO_COLOR")
+        console_handler.setFormatter(_CONSOLE_FORMATTER if use_color else _PLAIN_CONSOLE_FORMATTER)
         logger.addHandler(console_handler)
 
     if log_to_file:
@@ -74,13 +237,21 @@ def setup_logger(
 
         log_file = os.path.join(log_dir, f"{name}.log")
 
-        file_handler = RotatingFileHandler(
+        file_handler = SizeTrackingFileHandler(
             log_file, maxBytes=max_file_size, backupCount=backup_count, encoding="utf-8"
         )
         file_handler.setLevel(logging.DEBUG)
-        file_formatter = logging.Formatter(file_format)
-        file_handler.setFormatter(file_formatter)
-        logger.addHandler(file_handler)
+        file_handler.setFormatter(_FILE_FORMATTER)
+        # Records are written in batches rather than one write per record;
+        # errors flush the buffer right away, and so does logging shutdown
+        logger.addHandler(
+            BufferedFileHandler(
+                capacity=FILE_BUFFER_RECORDS,
+                flushLevel=logging.ERROR,
+                target=file_handler,
+                flushOnClose=True,
+            )
+        )
 
         logger.info(f"Logs are being saved to file: {log_file}")
 
@@ -99,23 +270,22 @@ def get_logger(name: str | None = None) -> logging.Logger:
     Returns:
         Logger
     """
-    if name is None:
-        name = "telebrief"
+    if name is None or name == APP_LOGGER_NAME:
+        if not _app_logger.handlers:
+            setup_logger(APP_LOGGER_NAME)
+        return _app_logger
 
-    if not name.startswith("telebrief") and "." not in name:
-        name = f"telebrief.{name}"
+    if not name.startswith(APP_LOGGER_NAME) and "." not in name:
+        name = f"{APP_LOGGER_NAME}.{name}"
 
-    logger = logging.getLogger(name)
-
-    if not logger.handlers and name == "telebrief":
-        return setup_logger(name)
-
-    return logger
+    return logging.getLogger(name)
 
 
 class ProgressLogger:
     """Progress logger for long operations."""
 
+    __slots__ = ("_next", "current", "description", "last_percent", "logger", "total")
+
     def __init__(self, logger: logging.Logger, total: int, description: str = "Progress"):
         """
         Args:
@@ -128,20 +298,33 @@ class ProgressLogger:
         self.description = description
         self.current = 0
         self.last_percent = -1
+        # Item count at which the next progress step is reached, so update()
+        # only compares integers between messages
+        self._next = self._items_for(PROGRESS_STEP_PERCENT) if total > 0 else sys.maxsize
+
+    def _items_for(self, percent: int) -> int:
+        """Smallest item count that reaches percent of the total."""
+        return -(-self.total * percent // 100)
 
     def update(self, amount: int = 1) -> None:
         """
         Updates progress.
 
+        Progress is reported each time it crosses a multiple of 10%.
+
         Args:
             amount: Number of processed items
         """
         self.current += amount
-        percent = int((self.current / self.total) * 100)
-
-        if percent != self.last_percent and percent % 10 == 0:
-            self.logger.info(f"{self.description}: {percent}% ({self.current}/{self.total})")
-            self.last_percent = percent
+        if self.current < self._next:
+            return
+
+        percent = self.current * 100 // self.total
+        self.logger.info(f"{self.description}: {percent}% ({self.current}/{self.total})")
+        self.last_percent = percent
+        self._next = self._items_for(
+            percent - percent % PROGRESS_STEP_PERCENT + PROGRESS_STEP_PERCENT
+        )
 
     def finish(self) -> None:
         """Completes progress."""
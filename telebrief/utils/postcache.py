@@ -0,0 +1,104 @@
+"""
+On-disk cache for parsed channel posts.
+"""
+
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from ..models import Channel
+from . import json_utils
+from .infocache import cache_path, write_json_atomic
+from .logger import get_logger
+
+SECONDS_PER_DAY = 24 * 60 * 60
+
+
+class PostCache:
+    """
+    TTL cache of parsed channels stored as one JSON file per channel.
+
+    Each entry remembers the window it was fetched for (days and post limit),
+    so a later request for a narrower window is answered by filtering the
+    cached posts instead of downloading them again.
+    """
+
+    def __init__(self, cache_dir: str | Path) -> None:
+        self.cache_dir = Path(cache_dir)
+        self.logger = get_logger(f"{__name__}.{self.__class__.__name__}")
+
+    def _path(self, channel: str) -> Path:
+        return cache_path(self.cache_dir, channel)
+
+    def load(self, channel: str, days: int, max_posts: int | None, ttl: float) -> Channel | None:
+        """
+        Return cached channel restricted to the requested window.
+
+        Args:
+            channel: Channel name
+            days: Number of days requested
+            max_posts: Post limit requested (None for no limit)
+            ttl: Maximum entry age in seconds
+
+        Returns:
+            Channel with posts from the last `days` days, or None if the cache
+            is missing, expired or doesn't cover the requested window
+        """
+        entry = self._read_entry(channel, ttl)
+        if entry is None:
+            return None
+
+        # The cached window must start no later than the requested one
+        age = time.time() - entry["cached_at"]
+        if entry.get("days", 0) * SECONDS_PER_DAY < days * SECONDS_PER_DAY + age:
+            return None
+
+        cached_channel = Channel.from_dict(entry.get("channel", {}))
+
+        # A limit that was actually hit means older posts in the window are missing
+        cached_limit: int | None = entry.get("max_posts")
+        limit_hit = cached_limit is not None and len(cached_channel.posts) >= cached_limit
+        if limit_hit and (max_posts is None or max_posts > (cached_limit or 0)):
+            return None
+
+        cutoff_date = datetime.now() - timedelta(days=days)
+        posts = [post for post in cached_channel.posts if post.date and post.date >= cutoff_date]
+        if max_posts:
+            posts = posts[-max_posts:]
+
+        return Channel(info=cached_channel.info, posts=posts)
+
+    def _read_entry(self, channel: str, ttl: float) -> dict | None:
+        """Read cache entry for channel if it exists and is younger than ttl seconds."""
+        if ttl <= 0:
+            return None
+
+        try:
+            entry = json_utils.loads(self._path(channel).read_bytes())
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(entry, dict) or time.time() - entry.get("cached_at", 0) > ttl:
+            return None
+
+        return entry
+
+    def store(self, channel: Channel, days: int, max_posts: int | None) -> None:
+        """
+        Store parsed channel. Write failures are logged, not raised.
+
+        Args:
+            channel: Parsed channel (posts sorted by date)
+            days: Number of days the channel was parsed for
+            max_posts: Post limit used while parsing
+        """
+        entry = {
+            "cached_at": time.time(),
+            "days": days,
+            "max_posts": max_posts,
+            "channel": channel.to_dict(),
+        }
+        try:
+            write_json_atomic(self._path(channel.info.channel), entry)
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Failed to cache posts for @{channel.info.channel}: {e}")
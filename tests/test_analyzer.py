@@ -2,6 +2,7 @@
 
 from datetime import datetime, timedelta
 
+import numpy as np
 import pytest
 
 from telebrief.core.analyzer import MetricsAnalyzer
@@ -96,12 +97,12 @@ class TestMetricsAnalyzer:
     def test_gini_coefficient(self, analyzer):
         """Test Gini coefficient calculation."""
         # Equal distribution
-        equal_values = [100.0] * 10
+        equal_values = np.full(10, 100.0)
         gini_equal = analyzer._calculate_gini(equal_values)
         assert gini_equal == pytest.approx(0.0, abs=0.01)
 
         # Unequal distribution
-        unequal_values = [10.0, 20.0, 30.0, 40.0, 500.0]
+        unequal_values = np.array([10.0, 20.0, 30.0, 40.0, 500.0])
         gini_unequal = analyzer._calculate_gini(unequal_values)
         assert gini_unequal > 0.5  # High inequality
 
@@ -117,3 +118,19 @@ class TestMetricsAnalyzer:
         for _period_key, metrics in results.items():
             assert isinstance(metrics, Metrics)
             assert metrics.analysis_period_days > 0
+
+    def test_analyze_channel_multi_matches_single(self, analyzer, test_channel):
+        """Test multi-period analysis matches per-period analysis."""
+        results = analyzer.analyze_channel_multi(test_channel, [7, 30])
+
+        assert list(results) == [7, 30]
+        for period, metrics in results.items():
+            assert metrics == analyzer.analyze_channel(test_channel, period)
+
+    def test_trend_analysis_windows(self, analyzer, test_channel):
+        """Test posts are split into consecutive windows."""
+        trend = analyzer.get_trend_analysis(test_channel, window_days=7)
+
+        counts = [window["posts_count"] for window in trend["windows"]]
+        assert sum(counts) == len(test_channel.posts)
+        assert trend["trend_direction"] in {"growing", "declining", "stable"}
@@ -0,0 +1,144 @@
+"""Tests for CLI module."""
+
+from unittest.mock import patch
+
+import pytest
+
+from telebrief.cli import (
+    create_parser,
+    extract_channel_name,
+    main,
+    parse_channels,
+    parse_channels_from_file,
+    setup_config_from_args,
+)
+
+
+class TestChannelParsing:
+    """Tests for channel list parsing helpers."""
+
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ("bloomberg", "bloomberg"),
+            ("@bloomberg", "bloomberg"),
+            ("t.me/bloomberg", "bloomberg"),
+            ("t.me/s/bloomberg", "bloomberg"),
+            ("https://t.me/Realta_Rent_IL", "Realta_Rent_IL"),
+            ("http://t.me/s/bloomberg/123?single", "bloomberg"),
+            ("  @bloomberg  ", "bloomberg"),
+            ("t.me/bloomberg/", "bloomberg"),
+            ("", ""),
+            ("foo bar", "foo bar"),
+            ("t.me/Foo-Bar", "t.me/Foo-Bar"),
+        ],
+    )
+    def test_extract_channel_name(self, text, expected):
+        """Test channel name extraction from supported formats."""
+        assert extract_channel_name(text) == expected
+
+    def test_parse_channels(self):
+        """Test comma-separated channel parsing."""
+        assert parse_channels("bloomberg, @insiderpaper,,t.me/s/realta_rent_il") == [
+            "bloomberg",
+            "insiderpaper",
+            "realta_rent_il",
+        ]
+
+    def test_parse_channels_from_file(self, tmp_path):
+        """Test reading channels with comments and comma-separated lines."""
+        channels_file = tmp_path / "channels.txt"
+        channels_file.write_text(
+            "# comment\nbloomberg\n\n@insiderpaper, t.me/realta_rent_il  # inline\n",
+            encoding="utf-8",
+        )
+
+        assert list(parse_channels_from_file(str(channels_file))) == [
+            "bloomberg",
+            "insiderpaper",
+            "realta_rent_il",
+        ]
+
+    def test_parse_channels_from_missing_file(self, tmp_path):
+        """Test missing channel file raises ValueError."""
+        with pytest.raises(ValueError, match="File not found"):
+            list(parse_channels_from_file(str(tmp_path / "missing.txt")))
+
+
+class TestSetupConfig:
+    """Tests for building configuration from arguments."""
+
+    def test_arguments_applied(self):
+        """Test arguments are copied to the matching config fields."""
+        args = create_parser().parse_args(
+            [
+                "@bloomberg,insiderpaper",
+                "--days", "7",
+                "--max-posts", "50",
+                "--periods", "7,30",
+                "--no-ssl",
+                "--no-metrics",
+                "--no-age-info",
+                "--proxy", "127.0.0.1:8081",
+            ]
+        )
+        config = setup_config_from_args(args)
+
+        assert config.channels == ["bloomberg", "insiderpaper"]
+        assert config.parsing.default_days == 7
+        assert config.parsing.max_posts == 50
+        assert config.analysis_periods == [7, 30]
+        assert config.network.verify_ssl is False
+        assert config.include_metrics is False
+        assert config.parsing.fetch_age_info is False
+        assert config.network.use_proxy is True
+        assert config.network.proxy_port == 8081
+
+    def test_defaults_kept(self):
+        """Test unset flags leave config defaults untouched."""
+        config = setup_config_from_args(create_parser().parse_args(["bloomberg"]))
+
+        assert config.network.use_proxy is False
+        assert config.include_metrics is True
+        assert config.parsing.fetch_age_info is True
+        assert config.parsing.max_posts is None
+
+    def test_channels_file_cleaned(self, tmp_path):
+        """Test channels from a file are normalized and deduplicated like arguments."""
+        channels_file = tmp_path / "channels.txt"
+        channels_file.write_text("Bloomberg\n@bloomberg, t.me/InsiderPaper\n", encoding="utf-8")
+        args = create_parser().parse_args(["ignored", "--channels-file", str(channels_file)])
+
+        config = setup_config_from_args(args)
+
+        assert config.channels == ["bloomberg", "insiderpaper"]
+
+    def test_main_reports_missing_channels_file(self, tmp_path, capsys):
+        """Test main exits with status 1 when the channel file can't be read."""
+        missing = str(tmp_path / "missing.txt")
+        with patch("sys.argv", ["telebrief", "--channels-file", missing]):
+            assert main() == 1
+
+        assert "File not found" in capsys.readouterr().err
+
+    def test_invalid_values_validated(self):
+        """Test argument values go through config validation."""
+        args = create_parser().parse_args(["bloomberg", "--proxy", "127.0.0.1:99999"])
+
+        with pytest.raises(ValueError, match="Invalid proxy port"):
+            setup_config_from_args(args)
+
+    @pytest.mark.parametrize("workers", ["0", "-2", "many"])
+    def test_workers_must_be_positive(self, workers, capsys):
+        """Test --workers rejects values below 1 with a usage error."""
+        with pytest.raises(SystemExit):
+            create_parser().parse_args(["bloomberg", "--workers", workers])
+
+        assert "--workers" in capsys.readouterr().err
+
+    def test_main_reports_invalid_config(self, capsys):
+        """Test main prints config errors and exits with status 1."""
+        with patch("sys.argv", ["telebrief", "bloomberg", "--periods", "a,b"]):
+            assert main() == 1
+
+        assert "Periods must be numbers" in capsys.readouterr().err
@@ -1,12 +1,12 @@
 """Tests for parser module."""
 
-from datetime import datetime
+from datetime import datetime, timedelta
 from unittest.mock import Mock, patch
 
 import pytest
 
 from telebrief import TelegramParser
-from telebrief.models import ChannelInfo, Post
+from telebrief.models import Channel, ChannelInfo, Post
 from telebrief.utils import Config
 
 
@@ -30,6 +30,7 @@ class TestTelegramParser:
         <div class="tgme_page_extra">1.5K subscribers</div>
         <div class="tgme_page_description">Test description</div>
         """
+        response.content = response.text.encode()
         return response
 
     def test_parse_number_with_suffix(self, parser):
@@ -39,6 +40,8 @@ class TestTelegramParser:
         assert parser._parse_number_with_suffix("1,234") == 1234
         assert parser._parse_number_with_suffix("500") == 500
         assert parser._parse_number_with_suffix("") == 0
+        assert parser._parse_number_with_suffix("1.2K subscribers") == 1200
+        assert parser._parse_number_with_suffix("12 345 members") == 12345
 
     @patch('telebrief.core.parser.TelegramParser._make_request')
     def test_get_channel_info(self, mock_request, parser, mock_response):
@@ -59,6 +62,94 @@ class TestTelegramParser:
         # html2text uses _ for italics and no <> wrapping with current settings
         assert markdown == '**Bold** _italic_ [link](http://example.com)'
 
+    def test_html_to_markdown_breaks_and_emoji(self, parser):
+        """Test line breaks, emoji, bare links and emphasis spacing in the built-in converter."""
+        html = (
+            '<i class="emoji" style="background-image:url(x)"><b>🔥</b></i> Hot<br/>  <br/>'
+            'Line  two <a href="https://t.me">https://t.me</a><!-- note --> end<br/>'
+            '<b> spaced </b>text and<i> </i>gap'
+        )
+        markdown = parser._html_to_markdown(html)
+        assert markdown == "🔥 Hot\nLine two <https://t.me> end\n**spaced** text and gap"
+
+    def test_parse_posts_from_html(self, parser):
+        """Test extracting posts and the next page token from a posts batch."""
+        html = (
+            '"<div class=\\"tme_messages_more_wrap js-messages_more_wrap\\">'
+            '<a href=\\"\\/s\\/testchannel?before=41\\" class=\\"tme_messages_more js-messages_more\\"><\\/a>'
+            '<\\/div>'
+            '<div class=\\"tgme_widget_message js-widget_message\\" data-post=\\"testchannel\\/41\\">'
+            '<span class=\\"tgme_widget_message_author_name\\">Alice<\\/span>'
+            '<div class=\\"tgme_widget_message_text js-message_text\\">Hello <b>world<\\/b><\\/div>'
+            '<span class=\\"tgme_widget_message_views\\">1.2K<\\/span>'
+            '<time datetime=\\"2024-01-01T10:00:00+00:00\\" class=\\"time\\">10:00<\\/time>'
+            '<\\/div>'
+            '<div class=\\"tgme_widget_message_wrap\\">'
+            '<div class=\\"tgme_widget_message js-widget_message\\" data-post=\\"testchannel\\/42\\">'
+            '<time datetime=\\"2024-01-02T10:00:00+00:00\\">10:00<\\/time>'
+            '<\\/div><\\/div>"'
+        )
+
+        posts, next_before = parser._parse_posts_from_html(html, "testchannel")
+
+        assert next_before == "41"
+        assert [post.post_id for post in posts] == ["41", "42"]
+        assert posts[0].author == "Alice"
+        assert posts[0].text == "Hello **world**"
+        assert posts[0].views == 1200
+        assert posts[0].date == datetime(2024, 1, 1, 10, 0)  # noqa: DTZ001
+        assert posts[1].author == "testchannel"
+        assert posts[1].views == 0
+
+    @patch('telebrief.core.parser.TelegramParser._make_request')
+    def test_get_posts_follows_pagination(self, mock_request, parser):
+        """Test pagination stops at the cutoff and requests each page once."""
+        now = datetime.now()
+
+        def page(first_id, age_days):
+            posts = "".join(
+                f'<div class="tgme_widget_message" data-post="testchannel/{post_id}">'
+                f'<time datetime="{(now - timedelta(days=age_days, minutes=-post_id)).isoformat()}">'
+                "</time></div>"
+                for post_id in range(first_id, first_id + 2)
+            )
+            more = (
+                '<div class="js-messages_more_wrap">'
+                f'<a class="js-messages_more" href="/s/testchannel?before={first_id}"></a></div>'
+            )
+            return Mock(content=(more + posts).encode())
+
+        pages = {None: page(5, 1), "5": page(3, 2), "3": page(1, 30)}
+        mock_request.side_effect = lambda *_, data: pages[data.get("before")]
+
+        posts, latest_post_id = parser._get_posts("testchannel", days=7)
+
+        assert [post.post_id for post in posts] == ["3", "4", "5", "6"]
+        assert latest_post_id == 5
+        requested = [call.kwargs["data"].get("before") for call in mock_request.call_args_list]
+        assert requested == [None, "5", "3"]
+
+    @pytest.mark.parametrize("last_page", [b'""', b'"\\n"', b'"<!-- x -->"'])
+    @patch('telebrief.core.parser.TelegramParser._make_request')
+    def test_get_posts_empty_last_page(self, mock_request, parser, last_page):
+        """Test an empty page ends pagination without losing collected posts."""
+        now = datetime.now()
+        posts_html = "".join(
+            f'<div class="tgme_widget_message" data-post="testchannel/{post_id}">'
+            f'<time datetime="{(now - timedelta(hours=post_id)).isoformat()}"></time></div>'
+            for post_id in (2, 1)
+        )
+        more = (
+            '<div class="js-messages_more_wrap">'
+            '<a class="js-messages_more" href="/s/testchannel?before=1"></a></div>'
+        )
+        pages = {None: Mock(content=(more + posts_html).encode()), "1": Mock(content=last_page)}
+        mock_request.side_effect = lambda *_, data: pages[data.get("before")]
+
+        posts, _ = parser._get_posts("testchannel", days=7)
+
+        assert [post.post_id for post in posts] == ["2", "1"]
+
     def test_validate_channel_name(self, parser):
         """Test channel name validation."""
         with pytest.raises(ValueError, match="Invalid channel name"):
@@ -103,3 +194,70 @@ class TestTelegramParser:
         assert channel.info.channel == "testchannel"
         assert len(channel.posts) == 1
         assert channel.posts[0].views == 1000
+
+    @pytest.mark.parametrize("async_threshold", [1, 10])
+    @patch('telebrief.core.parser.TelegramParser.parse_channel')
+    def test_parse_multiple_channels_skips_failures(self, mock_parse, parser, async_threshold):
+        """Test batch parsing keeps input order and skips failed channels."""
+        parser.config.network.async_threshold = async_threshold
+
+        def fake_parse(name, days):
+            if name == "broken":
+                raise ValueError("boom")
+            return Channel(info=ChannelInfo(channel=name))
+
+        mock_parse.side_effect = fake_parse
+
+        results = parser.parse_multiple_channels(["first", "broken", "second"], days=7)
+
+        assert list(results) == ["first", "second"]
+        assert results["second"].info.channel == "second"
+
+    @patch('telebrief.core.parser.TelegramParser._get_posts')
+    @patch('telebrief.core.parser.TelegramParser._get_channel_info')
+    def test_channel_info_cache(self, mock_info, mock_posts, tmp_path):
+        """Test channel info is served from the on-disk cache on repeat runs."""
+        config = Config(cache_dir=str(tmp_path))
+        config.parsing.fetch_age_info = False
+        config.parsing.info_cache_ttl = 3600
+        parser = TelegramParser(config)
+
+        mock_info.return_value = ChannelInfo(
+            channel="testchannel", name="Test Channel", subscribers=1000
+        )
+        mock_posts.return_value = ([], None)
+
+        parser.parse_channel("testchannel", days=7)
+        channel = parser.parse_channel("testchannel", days=7)
+
+        assert mock_info.call_count == 1
+        assert channel.info.name == "Test Channel"
+        assert channel.info.subscribers == 1000
+
+    @patch('telebrief.core.parser.TelegramParser._get_posts')
+    @patch('telebrief.core.parser.TelegramParser._get_channel_info')
+    def test_post_cache_serves_narrower_window(self, mock_info, mock_posts, tmp_path):
+        """Test cached posts answer a shorter period without re-parsing."""
+        config = Config(cache_dir=str(tmp_path))
+        config.parsing.fetch_age_info = False
+        config.parsing.post_cache_ttl = 3600
+        parser = TelegramParser(config)
+
+        now = datetime.now()
+        mock_info.return_value = ChannelInfo(channel="testchannel", subscribers=1000)
+        mock_posts.return_value = (
+            [
+                Post(post_id="1", views=100, date=now - timedelta(days=20)),
+                Post(post_id="2", views=200, date=now - timedelta(days=2)),
+            ],
+            2,
+        )
+
+        parser.parse_channel("testchannel", days=30)
+        channel = parser.parse_channel("testchannel", days=7)
+
+        assert mock_posts.call_count == 1
+        assert [post.post_id for post in channel.posts] == ["2"]
+
+        parser.parse_channel("testchannel", days=60)
+        assert mock_posts.call_count == 2
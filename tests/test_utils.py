@@ -0,0 +1,321 @@
+"""Tests for utility modules."""
+
+import logging
+from datetime import UTC, date, datetime, timedelta, timezone
+from unittest.mock import patch
+
+import pytest
+
+from telebrief.utils import InfoCache, TokenBucket, parse_date
+from telebrief.utils.logger import BufferedFileHandler, SizeTrackingFileHandler, setup_logger
+
+
+class TestParseDate:
+    """Tests for parse_date function."""
+
+    def test_offset_string_converted_to_utc(self):
+        """Test a string with a non-UTC offset is converted to naive UTC."""
+        assert parse_date("2024-01-02T03:04:05+03:00") == datetime(2024, 1, 2, 0, 4, 5)  # noqa: DTZ001
+
+    def test_trailing_z(self):
+        """Test a trailing Z is read as UTC."""
+        assert parse_date("2024-01-02T03:04:05Z") == datetime(2024, 1, 2, 3, 4, 5)  # noqa: DTZ001
+
+    def test_naive_string_kept(self):
+        """Test a string without an offset is returned as is."""
+        assert parse_date("2024-01-02T03:04:05") == datetime(2024, 1, 2, 3, 4, 5)  # noqa: DTZ001
+
+    def test_aware_datetime_converted_to_utc(self):
+        """Test an aware datetime is converted to naive UTC."""
+        value = datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone(timedelta(hours=-2)))
+
+        result = parse_date(value)
+
+        assert result == datetime(2024, 1, 2, 5, 4, 5)  # noqa: DTZ001
+        assert result.tzinfo is None
+
+    def test_utc_datetime(self):
+        """Test an aware UTC datetime keeps its wall-clock time."""
+        value = datetime(2024, 1, 2, 3, 4, 5, tzinfo=UTC)
+        assert parse_date(value) == datetime(2024, 1, 2, 3, 4, 5)  # noqa: DTZ001
+
+    def test_none(self):
+        """Test None gives None."""
+        assert parse_date(None) is None
+
+    @pytest.mark.parametrize("value", [date(2024, 1, 2), 1704164645, 1.5, ["2024-01-02"]])
+    def test_unsupported_type(self, value):
+        """Test values of unsupported types give None."""
+        assert parse_date(value) is None
+
+    def test_datetime_subclass(self):
+        """Test datetime subclasses dispatch to the datetime implementation."""
+
+        class CustomDatetime(datetime):
+            pass
+
+        value = CustomDatetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone(timedelta(hours=1)))
+        assert parse_date(value) == datetime(2024, 1, 2, 2, 4, 5)  # noqa: DTZ001
+
+    def test_str_subclass(self):
+        """Test str subclasses dispatch to the string implementation."""
+
+        class CustomStr(str):
+            __slots__ = ()
+
+        assert parse_date(CustomStr("2024-01-02T03:04:05")) == datetime(2024, 1, 2, 3, 4, 5)  # noqa: DTZ001
+
+    def test_malformed_string(self, caplog):
+        """Test a malformed string logs a warning and gives None."""
+        with caplog.at_level(logging.WARNING):
+            assert parse_date("not a date") is None
+
+        assert "Failed to parse date: not a date" in caplog.text
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket rate limiter."""
+
+    @pytest.fixture
+    def clock(self):
+        """Patches time so sleeping advances the monotonic clock."""
+        now = [100.0]
+        sleeps = []
+
+        def sleep(seconds):
+            sleeps.append(seconds)
+            now[0] += seconds
+
+        with patch("telebrief.utils.ratelimit.time") as mock_time:
+            mock_time.monotonic.side_effect = lambda: now[0]
+            mock_time.sleep.side_effect = sleep
+            yield sleeps
+
+    def test_burst_passes_without_waiting(self, clock):
+        """Test up to burst requests are let through immediately."""
+        bucket = TokenBucket(rate=2.0, burst=3)
+
+        for _ in range(3):
+            bucket.acquire()
+
+        assert clock == []
+
+    def test_waits_after_burst(self, clock):
+        """Test requests past the burst wait 1/rate each."""
+        bucket = TokenBucket(rate=2.0, burst=2)
+
+        for _ in range(5):
+            bucket.acquire()
+
+        assert clock == pytest.approx([0.5, 0.5, 0.5])
+
+    def test_concurrent_reservations_queue_up(self):
+        """Test callers arriving at the same moment are spaced 1/rate apart."""
+        with patch("telebrief.utils.ratelimit.time") as mock_time:
+            # The clock stands still, as for callers that all arrive before any wakes up
+            mock_time.monotonic.return_value = 100.0
+            bucket = TokenBucket(rate=4.0, burst=1)
+
+            for _ in range(3):
+                bucket.acquire()
+
+        waits = [call.args[0] for call in mock_time.sleep.call_args_list]
+        assert waits == pytest.approx([0.25, 0.5])
+
+    def test_idle_time_refills_up_to_burst(self, clock):
+        """Test tokens refill while idle but never above the burst size."""
+        bucket = TokenBucket(rate=1.0, burst=2)
+        bucket.acquire()
+        bucket.acquire()
+        clock.clear()
+
+        # A long idle period refills only up to the burst size
+        bucket._updated -= 60
+        for _ in range(3):
+            bucket.acquire()
+
+        assert clock == pytest.approx([1.0])
+
+    @pytest.mark.parametrize(
+        ("rate", "burst", "message"),
+        [
+            (0, 1, "Rate must be positive"),
+            (-1.0, 1, "Rate must be positive"),
+            (1.0, 0, "Burst must be at least 1"),
+        ],
+    )
+    def test_invalid_parameters(self, rate, burst, message):
+        """Test invalid rate and burst raise ValueError."""
+        with pytest.raises(ValueError, match=message):
+            TokenBucket(rate=rate, burst=burst)
+
+
+class TestInfoCache:
+    """Tests for InfoCache on-disk cache."""
+
+    def test_roundtrip(self, tmp_path):
+        """Test stored info is returned within the TTL."""
+        cache = InfoCache(tmp_path)
+        cache.set("Bloomberg", {"name": "Bloomberg"})
+
+        assert cache.get("bloomberg", ttl=60) == {"name": "Bloomberg"}
+        assert cache.get("bloomberg", ttl=0) is None
+
+    @pytest.mark.parametrize("channel", ["../x", "a/b", "", "x.y"])
+    def test_rejects_names_outside_cache_dir(self, tmp_path, channel):
+        """Test names that are not plain usernames are neither written nor read."""
+        cache_dir = tmp_path / "cache"
+        cache = InfoCache(cache_dir)
+
+        cache.set(channel, {"name": "x"})
+
+        assert cache.get(channel, ttl=60) is None
+        assert list(tmp_path.rglob("*.json")) == []
+
+
+class CountingStream:
+    """File stream wrapper that counts write and flush calls."""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.writes = 0
+        self.flushes = 0
+
+    def write(self, data):
+        self.writes += 1
+        return self.stream.write(data)
+
+    def flush(self):
+        self.flushes += 1
+        self.stream.flush()
+
+    def close(self):
+        self.stream.close()
+
+
+def make_records(count, message="record"):
+    """Creates INFO log records."""
+    return [
+        logging.LogRecord("telebrief.test", logging.INFO, __file__, 1, f"{message} {i}", None, None)
+        for i in range(count)
+    ]
+
+
+class TestSizeTrackingFileHandler:
+    """Tests for SizeTrackingFileHandler."""
+
+    def test_emit_many_writes_once(self, tmp_path):
+        """Test a batch of records is written with one write and one flush."""
+        log_file = tmp_path / "test.log"
+        handler = SizeTrackingFileHandler(str(log_file), encoding="utf-8")
+        stream = handler.stream = CountingStream(handler.stream)
+
+        handler.emit_many(make_records(500))
+        counts = (stream.writes, stream.flushes)
+        handler.close()
+
+        assert counts == (1, 1)
+        assert len(log_file.read_text(encoding="utf-8").splitlines()) == 500
+        assert handler._size == log_file.stat().st_size
+
+    def test_emit_many_filters_by_level(self, tmp_path):
+        """Test records below the handler level are skipped."""
+        log_file = tmp_path / "test.log"
+        handler = SizeTrackingFileHandler(str(log_file), encoding="utf-8")
+        handler.setLevel(logging.WARNING)
+        records = make_records(2)
+        records[1].levelno = logging.ERROR
+
+        handler.emit_many(records)
+        handler.close()
+
+        assert log_file.read_text(encoding="utf-8") == "record 1\n"
+
+    def test_emit_many_rolls_over(self, tmp_path):
+        """Test a batch larger than the size limit is split across log files."""
+        log_file = tmp_path / "test.log"
+        handler = SizeTrackingFileHandler(
+            str(log_file), maxBytes=100, backupCount=5, encoding="utf-8"
+        )
+
+        handler.emit_many(make_records(20, "message"))
+        handler.close()
+
+        files = sorted(tmp_path.glob("test.log*"))
+        assert len(files) > 1
+        assert all(path.stat().st_size <= 100 for path in files)
+        total_lines = sum(len(path.read_text(encoding="utf-8").splitlines()) for path in files)
+        assert total_lines == 20
+
+
+class TestBufferedFileHandler:
+    """Tests for BufferedFileHandler."""
+
+    def test_flush_writes_buffer_once(self, tmp_path):
+        """Test a full buffer reaches the log file in one write and one flush."""
+        log_file = tmp_path / "test.log"
+        file_handler = SizeTrackingFileHandler(str(log_file), encoding="utf-8")
+        stream = file_handler.stream = CountingStream(file_handler.stream)
+        handler = BufferedFileHandler(capacity=1000, target=file_handler)
+
+        for record in make_records(500):
+            handler.handle(record)
+        assert stream.writes == 0
+
+        handler.flush()
+        counts = (stream.writes, stream.flushes)
+        handler.close()
+        file_handler.close()
+
+        assert counts == (1, 1)
+        assert handler.buffer == []
+        assert len(log_file.read_text(encoding="utf-8").splitlines()) == 500
+
+    def test_error_flushes_buffer(self, tmp_path):
+        """Test a record at the flush level writes out the buffer with it."""
+        log_file = tmp_path / "test.log"
+        file_handler = SizeTrackingFileHandler(str(log_file), encoding="utf-8")
+        handler = BufferedFileHandler(capacity=1000, flushLevel=logging.ERROR, target=file_handler)
+        records = make_records(3)
+        records[2].levelno = logging.ERROR
+
+        for record in records:
+            handler.handle(record)
+
+        assert log_file.read_text(encoding="utf-8").splitlines() == [
+            "record 0",
+            "record 1",
+            "record 2",
+        ]
+        handler.close()
+        file_handler.close()
+
+
+class TestSetupLogger:
+    """Tests for setup_logger level handling."""
+
+    @pytest.mark.parametrize(
+        ("level", "expected"),
+        [
+            ("debug", logging.DEBUG),
+            ("INFO", logging.INFO),
+            ("warn", logging.WARNING),
+            ("WARNING", logging.WARNING),
+            ("Critical", logging.CRITICAL),
+            ("NOTSET", logging.NOTSET),
+        ],
+    )
+    def test_level_names_accepted(self, level, expected):
+        """Test level names are matched case-insensitively, including logging aliases."""
+        logger = setup_logger(
+            "telebrief.test_levels", level=level, log_to_file=False, console_output=False
+        )
+
+        assert logger.level == expected
+
+    def test_unknown_level_rejected(self):
+        """Test an unknown level name raises ValueError listing the valid names."""
+        with pytest.raises(ValueError, match="Valid levels: DEBUG, INFO"):
+            setup_logger(
+                "telebrief.test_levels", level="bogus", log_to_file=False, console_output=False
+            )